@@ -1,9 +1,15 @@
 """Environment variable configuration utilities for MLS Match Scraper CLI."""
 
 import os
+import stat
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
+from dotenv import dotenv_values
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -11,133 +17,230 @@ from rich.table import Table
 
 console = Console()
 
-# Required and optional environment variables
-REQUIRED_ENV_VARS: dict[str, dict[str, Any]] = {
-    "MISSING_TABLE_API_BASE_URL": {
-        "description": "API endpoint for missing-table service",
-        "default": "https://api.missing-table.com",
-        "example": "https://api.missing-table.com",
-    },
-    "MISSING_TABLE_API_TOKEN": {
-        "description": "API token for missing-table service (your SA token)",
-        "default": None,
-        "example": "your-service-account-token-here",
-        "sensitive": True,
-    },
-}
 
-OPTIONAL_ENV_VARS: dict[str, dict[str, Any]] = {
-    "LOG_LEVEL": {
-        "description": "Logging level for CLI",
-        "default": "WARNING",
-        "example": "INFO",
-        "choices": ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-    },
-    "AGE_GROUP": {
-        "description": "Default age group",
-        "default": "U14",
-        "example": "U16",
-        "choices": ["U13", "U14", "U15", "U16", "U17", "U18", "U19"],
-    },
-    "DIVISION": {
-        "description": "Default division",
-        "default": "Northeast",
-        "example": "Southwest",
-        "choices": [
-            "Northeast",
-            "Southeast",
-            "Central",
-            "Southwest",
-            "Northwest",
-            "Mid-Atlantic",
-            "Great Lakes",
-            "Texas",
-            "California",
-        ],
-    },
-    "LOOK_BACK_DAYS": {
-        "description": "Default number of days to look ahead",
-        "default": "3",
-        "example": "7",
-    },
+class MissingConfigError(Exception):
+    """Raised when required environment variables are not configured."""
+
+    def __init__(self, missing: list[str]) -> None:
+        super().__init__(f"Missing required variables: {', '.join(missing)}")
+        self.missing = missing
+
+
+# Parsed .env contents keyed by path, tagged with the file's mtime when read
+_ENV_CACHE: dict[Path, tuple[int, dict[str, str]]] = {}
+
+# Set while configure_session() is active: set_variable() updates _PENDING and
+# the file is written once when the session ends
+_BATCH_MODE = False
+_PENDING: Optional[dict[str, str]] = None
+
+# Last validate_config() result: (required env values, .env path, .env mtime)
+# and the required variables that were missing
+_VALIDATION_CACHE: Optional[tuple[tuple[Any, ...], list[str]]] = None
+
+# Required and optional environment variables (read-only; choices are tuples)
+REQUIRED_ENV_VARS: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {
+        "MISSING_TABLE_API_BASE_URL": {
+            "description": "API endpoint for missing-table service",
+            "default": "https://api.missing-table.com",
+            "example": "https://api.missing-table.com",
+        },
+        "MISSING_TABLE_API_TOKEN": {
+            "description": "API token for missing-table service (your SA token)",
+            "default": None,
+            "example": "your-service-account-token-here",
+            "sensitive": True,
+        },
+    }
+)
+
+OPTIONAL_ENV_VARS: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {
+        "LOG_LEVEL": {
+            "description": "Logging level for CLI",
+            "default": "WARNING",
+            "example": "INFO",
+            "choices": ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+        },
+        "AGE_GROUP": {
+            "description": "Default age group",
+            "default": "U14",
+            "example": "U16",
+            "choices": ("U13", "U14", "U15", "U16", "U17", "U18", "U19"),
+        },
+        "DIVISION": {
+            "description": "Default division",
+            "default": "Northeast",
+            "example": "Southwest",
+            "choices": (
+                "Northeast",
+                "Southeast",
+                "Central",
+                "Southwest",
+                "Northwest",
+                "Mid-Atlantic",
+                "Great Lakes",
+                "Texas",
+                "California",
+            ),
+        },
+        "LOOK_BACK_DAYS": {
+            "description": "Default number of days to look ahead",
+            "default": "3",
+            "example": "7",
+        },
+    }
+)
+
+# Flattened copies of the tables above for set_variable(), get_current_config()
+# and validate_config()
+_REQUIRED_NAMES = tuple(REQUIRED_ENV_VARS)
+_OPTIONAL_NAMES = tuple(OPTIONAL_ENV_VARS)
+_ALL_VAR_NAMES = frozenset(_REQUIRED_NAMES + _OPTIONAL_NAMES)
+_CHOICES_FROZEN = {
+    name: frozenset(info["choices"])
+    for name, info in OPTIONAL_ENV_VARS.items()
+    if "choices" in info
 }
+_OPTIONAL_DEFAULTS = MappingProxyType(
+    {name: info["default"] for name, info in OPTIONAL_ENV_VARS.items()}
+)
 
 
-def get_env_file_path() -> Path:
-    """Get the path to the .env file in the project root."""
-    # Find project root by looking for pyproject.toml
-    current_path = Path.cwd()
+@lru_cache(maxsize=8)
+def _resolve_root(cwd: Path) -> Path:
+    """Find the project root above cwd by looking for pyproject.toml."""
+    current_path = cwd
     while current_path != current_path.parent:
         if (current_path / "pyproject.toml").exists():
-            return current_path / ".env"
+            return current_path
         current_path = current_path.parent
 
     # Fallback to current directory
-    return Path.cwd() / ".env"
+    return cwd
+
+
+def get_env_file_path() -> Path:
+    """Get the path to the .env file in the project root."""
+    return _resolve_root(Path.cwd()) / ".env"
 
 
 def load_env_file() -> dict[str, str]:
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file.
+
+    Parsed contents are cached per path and reused until the file's mtime
+    changes. Callers get their own copy and may modify it.
+    """
     env_file = get_env_file_path()
-    env_vars = {}
 
-    if env_file.exists():
-        try:
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        # Remove quotes if present
-                        value = value.strip("\"'")
-                        env_vars[key.strip()] = value
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not read .env file: {e}[/yellow]")
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+
+    cached = _ENV_CACHE.get(env_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return dict(cached[1])
+
+    try:
+        # Values are kept verbatim: tokens may legitimately contain '$'
+        parsed = dotenv_values(env_file, interpolate=False)
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not read .env file: {e}[/yellow]")
+        return {}
+
+    # Bare keys without '=' parse to None; they carry no value to load
+    env_vars = {key: value for key, value in parsed.items() if value is not None}
+
+    _ENV_CACHE[env_file] = (mtime_ns, env_vars)
+    return dict(env_vars)
 
-    return env_vars
+
+# Characters that make an unquoted .env value parse differently
+_QUOTE_CHARS = frozenset("#\"'\\")
+
+
+def _quote(value: str) -> str:
+    """Double-quote a .env value that contains whitespace, '#', quotes or '\\'.
+
+    Backslashes and double quotes are escaped so the value loads back
+    unchanged.
+    """
+    if any(c.isspace() or c in _QUOTE_CHARS for c in value):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return value
 
 
 def save_env_file(env_vars: dict[str, str]) -> bool:
-    """Save environment variables to .env file."""
+    """Save environment variables to .env file.
+
+    The file is written to a temporary sibling and renamed over the original,
+    so an interrupted save never leaves a truncated .env behind. The original
+    file's permissions are kept (new files are private to the owner), and a
+    symlinked .env is saved through to its target.
+    """
+    global _VALIDATION_CACHE
+
     env_file = get_env_file_path()
+    target = env_file.resolve()
+    tmp_file = target.with_name(target.name + ".tmp")
+    # Don't trust the mtime checks across a rewrite within one timestamp tick
+    _ENV_CACHE.pop(env_file, None)
+    _VALIDATION_CACHE = None
+
+    content = "".join(
+        [
+            "# MLS Match Scraper Environment Configuration\n",
+            "# Generated by mls-scraper config command\n\n",
+            *(f"{key}={_quote(value)}\n" for key, value in env_vars.items()),
+        ]
+    )
 
     try:
-        # Create directory if it doesn't exist
-        env_file.parent.mkdir(parents=True, exist_ok=True)
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except OSError:
+        mode = 0o600
 
-        with open(env_file, "w") as f:
-            f.write("# MLS Match Scraper Environment Configuration\n")
-            f.write("# Generated by mls-scraper config command\n\n")
+    try:
+        # Create directory if it doesn't exist
+        target.parent.mkdir(parents=True, exist_ok=True)
 
-            for key, value in env_vars.items():
-                f.write(f"{key}={value}\n")
+        # Never let the token sit in a more permissive file, even briefly
+        tmp_file.unlink(missing_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(tmp_file, mode)
+        os.replace(tmp_file, target)
 
         return True
     except Exception as e:
+        with suppress(OSError):
+            tmp_file.unlink(missing_ok=True)
         console.print(f"[red]Error saving .env file: {e}[/red]")
         return False
 
 
 def get_current_config() -> tuple[dict[str, Optional[str]], dict[str, Optional[str]]]:
     """Get current configuration from environment and .env file."""
-    env_file_vars = load_env_file()
-
-    required_config = {}
-    optional_config = {}
-
-    # Check required variables
-    for var_name in REQUIRED_ENV_VARS:
-        # Check environment first, then .env file
-        value = os.getenv(var_name) or env_file_vars.get(var_name)
-        required_config[var_name] = value
-
-    # Check optional variables
-    for var_name, var_info in OPTIONAL_ENV_VARS.items():
-        # Check environment first, then .env file, then default
-        value = (
-            os.getenv(var_name) or env_file_vars.get(var_name) or var_info["default"]
-        )
-        optional_config[var_name] = value
+    # Check environment first, reading each variable once
+    environ_get = os.environ.get
+    required_config = {name: environ_get(name) for name in _REQUIRED_NAMES}
+    optional_config = {name: environ_get(name) for name in _OPTIONAL_NAMES}
+
+    # Then the .env file, which is only read when something is still unset
+    if not all(required_config.values()) or not all(optional_config.values()):
+        env_file_vars = load_env_file()
+        for config in (required_config, optional_config):
+            for var_name, value in config.items():
+                if not value:
+                    config[var_name] = env_file_vars.get(var_name)
+
+    # Then defaults for optional variables
+    for var_name, default in _OPTIONAL_DEFAULTS.items():
+        optional_config[var_name] = optional_config[var_name] or default
 
     return required_config, optional_config
 
@@ -283,25 +386,39 @@ def interactive_setup() -> None:
         console.print("[red]❌ Failed to save configuration[/red]")
 
 
-def set_variable(var_name: str, value: str) -> bool:
-    """Set a specific environment variable."""
+def set_variable(
+    var_name: str, value: str, *, current: Optional[dict[str, str]] = None
+) -> bool:
+    """Set a specific environment variable.
+
+    Callers that already hold the .env contents can pass them as ``current``
+    to skip reloading the file; the dict is updated in place and saved.
+    Inside configure_session() the value goes to the session's pending
+    values instead and ``current`` is not used.
+    """
     # Validate variable name
-    all_vars = {**REQUIRED_ENV_VARS, **OPTIONAL_ENV_VARS}
-    if var_name not in all_vars:
+    if var_name not in _ALL_VAR_NAMES:
         console.print(f"[red]Unknown variable: {var_name}[/red]")
-        console.print(f"Valid variables: {', '.join(all_vars.keys())}")
+        console.print(
+            f"Valid variables: {', '.join([*REQUIRED_ENV_VARS, *OPTIONAL_ENV_VARS])}"
+        )
         return False
 
-    var_info = all_vars[var_name]
-
     # Validate choices if applicable
-    if var_info.get("choices") and value not in var_info["choices"]:
+    if var_name in _CHOICES_FROZEN and value not in _CHOICES_FROZEN[var_name]:
         console.print(f"[red]Invalid value for {var_name}: {value}[/red]")
-        console.print(f"Valid choices: {', '.join(var_info['choices'])}")
+        console.print(
+            f"Valid choices: {', '.join(OPTIONAL_ENV_VARS[var_name]['choices'])}"
+        )
         return False
 
-    # Load current config and update
-    env_vars = load_env_file()
+    if _BATCH_MODE and _PENDING is not None:
+        _PENDING[var_name] = value
+        console.print(f"[green]✅ Set {var_name} = {value}[/green]")
+        return True
+
+    # Load current config (unless the caller has it) and update
+    env_vars = current if current is not None else load_env_file()
     env_vars[var_name] = value
 
     if save_env_file(env_vars):
@@ -312,15 +429,67 @@ def set_variable(var_name: str, value: str) -> bool:
         return False
 
 
-def validate_config() -> bool:
-    """Validate current configuration and return True if all required vars are set."""
-    required_config, _ = get_current_config()
+@contextmanager
+def configure_session() -> Iterator[None]:
+    """Batch set_variable() calls into a single .env write.
+
+    The .env file is loaded once on entry and saved once on exit, including
+    when the block raises, so values set before an error are kept just as
+    they would be without batching. A nested session joins the active one,
+    which does the loading and saving.
+    """
+    global _BATCH_MODE, _PENDING
 
-    missing_vars = [var for var, value in required_config.items() if not value]
+    if _BATCH_MODE:
+        yield
+        return
+
+    _PENDING = load_env_file()
+    _BATCH_MODE = True
+    try:
+        yield
+    finally:
+        _BATCH_MODE = False
+        pending, _PENDING = _PENDING, None
+        if not save_env_file(pending):
+            console.print("[red]❌ Failed to save configuration[/red]")
+
+
+def _validation_key() -> tuple[Any, ...]:
+    """Snapshot of everything validate_config() depends on."""
+    env_file = get_env_file_path()
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    env_values = tuple(os.environ.get(name) for name in _REQUIRED_NAMES)
+    return env_values, env_file, mtime_ns
+
+
+def check_config() -> None:
+    """Raise MissingConfigError if any required variable is unset."""
+    global _VALIDATION_CACHE
+
+    # Reuse the last verdict while the environment and .env file are unchanged
+    key = _validation_key()
+    if _VALIDATION_CACHE is not None and _VALIDATION_CACHE[0] == key:
+        missing_vars = _VALIDATION_CACHE[1]
+    else:
+        required_config, _ = get_current_config()
+        missing_vars = [var for var, value in required_config.items() if not value]
+        _VALIDATION_CACHE = (key, missing_vars)
 
     if missing_vars:
+        raise MissingConfigError(list(missing_vars))
+
+
+def validate_config() -> bool:
+    """Validate current configuration and return True if all required vars are set."""
+    try:
+        check_config()
+    except MissingConfigError as e:
         console.print("[red]❌ Missing required environment variables:[/red]")
-        for var in missing_vars:
+        for var in e.missing:
             var_info = REQUIRED_ENV_VARS[var]
             console.print(f"  • {var}: {var_info['description']}")
         console.print(
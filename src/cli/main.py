@@ -111,6 +111,10 @@ VALID_CONFERENCES = [
     "California",
 ]
 
+# Hashed copies of the ordered lists above for membership checks
+_VALID_AGE_GROUP_SET = frozenset(VALID_AGE_GROUPS)
+_VALID_DIVISION_SET = frozenset(VALID_DIVISIONS)
+
 
 # Team name mappings for display
 TEAM_NAME_MAPPINGS = {
@@ -830,7 +834,7 @@ def scrape(
     setup_environment(verbose)
 
     # Validate inputs
-    if age_group not in VALID_AGE_GROUPS:
+    if age_group not in _VALID_AGE_GROUP_SET:
         console.print(f"[red]❌ Invalid age group: {age_group}[/red]")
         console.print(f"Valid options: {', '.join(VALID_AGE_GROUPS)}")
         raise typer.Exit(1)
@@ -842,7 +846,7 @@ def scrape(
 
     # Validate league-specific parameters
     if league == "Homegrown":
-        if division not in VALID_DIVISIONS:
+        if division not in _VALID_DIVISION_SET:
             console.print(f"[red]❌ Invalid division: {division}[/red]")
             console.print(f"Valid options: {', '.join(VALID_DIVISIONS)}")
             raise typer.Exit(1)
@@ -2340,7 +2344,7 @@ def discover(
     setup_environment(verbose)
 
     # Validate division
-    if division not in VALID_DIVISIONS:
+    if division not in _VALID_DIVISION_SET:
         console.print(
             f"[red]Invalid division: {division}[/red]\n"
             f"[dim]Valid divisions: {', '.join(VALID_DIVISIONS)}[/dim]"
@@ -2360,7 +2364,7 @@ def discover(
     if age_groups:
         parsed_age_groups = [ag.strip() for ag in age_groups.split(",")]
         for ag in parsed_age_groups:
-            if ag not in VALID_AGE_GROUPS:
+            if ag not in _VALID_AGE_GROUP_SET:
                 console.print(
                     f"[red]Invalid age group: {ag}[/red]\n"
                     f"[dim]Valid age groups: {', '.join(VALID_AGE_GROUPS)}[/dim]"
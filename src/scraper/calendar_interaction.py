@@ -7,7 +7,9 @@ and applying filters with comprehensive error handling.
 """
 
 import asyncio
+import re
 from datetime import date
+from functools import lru_cache
 from typing import Optional
 
 from playwright.async_api import Frame, Page
@@ -17,6 +19,58 @@ from .browser import ElementInteractor
 
 logger = get_logger()
 
+# Settle delays between widget clicks; tests replace this alias rather than
+# asyncio.sleep itself
+_sleep = asyncio.sleep
+
+# Common patterns for month/year display
+_MONTH_YEAR_PATTERNS = [
+    re.compile(r"(\w+)\s*,?\s*(\d{4})"),  # "January 2024" or "January, 2024"
+    re.compile(r"(\d{1,2})/(\d{4})"),  # "01/2024"
+    re.compile(r"(\d{4})-(\d{1,2})"),  # "2024-01"
+]
+
+
+@lru_cache(maxsize=512)
+def _parse_month_year_cached(text: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    Parse month and year from calendar header text.
+
+    Calendar navigation re-reads the same few headers, so results are cached.
+
+    Args:
+        text: Calendar header text (e.g., "January 2024", "01/2024")
+
+    Returns:
+        Tuple of (month, year) or (None, None) if parsing fails
+    """
+    for i, pattern in enumerate(_MONTH_YEAR_PATTERNS):
+        match = pattern.search(text)
+        if match:
+            group1, group2 = match.groups()
+
+            # Handle different patterns
+            if i == 2:  # "2024-01" pattern - year first, then month
+                year_str, month_str = group1, group2
+            else:  # Other patterns - month first, then year
+                month_str, year_str = group1, group2
+
+            # Try to parse month
+            month: Optional[int]
+            try:
+                month = int(month_str)
+            except ValueError:
+                month = MLSCalendarInteractor._MONTH_MAP.get(month_str.lower().strip())
+
+            try:
+                year = int(year_str)
+                if month and 1 <= month <= 12:
+                    return month, year
+            except ValueError:
+                pass
+
+    return None, None
+
 
 class CalendarInteractionError(Exception):
     """Custom exception for calendar interaction failures."""
@@ -50,6 +104,34 @@ class MLSCalendarInteractor:
     NEXT_MONTH_BUTTON_SELECTOR = ".next-month, .datepicker-next"
     PREV_MONTH_BUTTON_SELECTOR = ".prev-month, .datepicker-prev"
 
+    # Full and abbreviated month names (lowercase) to month number
+    _MONTH_MAP = {
+        "january": 1,
+        "jan": 1,
+        "february": 2,
+        "feb": 2,
+        "march": 3,
+        "mar": 3,
+        "april": 4,
+        "apr": 4,
+        "may": 5,
+        "june": 6,
+        "jun": 6,
+        "july": 7,
+        "jul": 7,
+        "august": 8,
+        "aug": 8,
+        "september": 9,
+        "sep": 9,
+        "sept": 9,
+        "october": 10,
+        "oct": 10,
+        "november": 11,
+        "nov": 11,
+        "december": 12,
+        "dec": 12,
+    }
+
     def __init__(self, page: Page, timeout: int = 15000):
         """
         Initialize calendar interactor.
@@ -316,7 +398,7 @@ class MLSCalendarInteractor:
                 return False
 
             # Small delay to allow UI to update
-            await asyncio.sleep(0.5)
+            await _sleep(0.5)
 
             # Select end date
             if not await self.select_date(end_date):
@@ -371,7 +453,7 @@ class MLSCalendarInteractor:
                         )
 
                         # Wait for page to update after applying filter
-                        await asyncio.sleep(2)
+                        await _sleep(2)
 
                         # Verify that calendar closed (optional)
                         calendar_closed = not await self.interactor.wait_for_element(
@@ -518,7 +600,7 @@ class MLSCalendarInteractor:
 
             await date_field.click()
             logger.debug("Clicked date field to open calendar")
-            await asyncio.sleep(2)
+            await _sleep(2)
 
             # Verify calendar picker opened
             calendar_picker = self.iframe_content.locator(".daterangepicker")
@@ -535,7 +617,7 @@ class MLSCalendarInteractor:
                 logger.error("Failed to navigate to start date month")
                 return False
 
-            await asyncio.sleep(1)
+            await _sleep(1)
 
             # Click start day on left calendar
             from_day = start_date.day
@@ -550,7 +632,7 @@ class MLSCalendarInteractor:
                 if await cell.count() > 0:
                     await cell.first.click()
                     logger.info(f"Clicked start date {from_day} on LEFT calendar")
-                    await asyncio.sleep(1)
+                    await _sleep(1)
                     from_clicked = True
                     break
 
@@ -580,7 +662,7 @@ class MLSCalendarInteractor:
                         logger.info(
                             f"Clicked end date {to_day} on {calendar_side.upper()} calendar"
                         )
-                        await asyncio.sleep(1)
+                        await _sleep(1)
                         to_clicked = True
                         break
             else:
@@ -590,7 +672,7 @@ class MLSCalendarInteractor:
                 ):
                     logger.error("Failed to navigate to end date month")
                     return False
-                await asyncio.sleep(1)
+                await _sleep(1)
 
                 to_selectors = [
                     f'.daterangepicker .drp-calendar.left td:has-text("{to_day}"):not(.off)',
@@ -603,7 +685,7 @@ class MLSCalendarInteractor:
                         logger.info(
                             f"Clicked end date {to_day} on LEFT calendar after navigation"
                         )
-                        await asyncio.sleep(1)
+                        await _sleep(1)
                         to_clicked = True
                         break
 
@@ -623,7 +705,7 @@ class MLSCalendarInteractor:
                 if await btn.count() > 0:
                     await btn.first.click()
                     logger.info(f"Clicked Apply button: {selector}")
-                    await asyncio.sleep(3)
+                    await _sleep(3)
                     apply_clicked = True
                     break
 
@@ -923,7 +1005,7 @@ class MLSCalendarInteractor:
                         return False
 
                 # Wait for UI to update after clicking nav button
-                await asyncio.sleep(0.5)
+                await _sleep(0.5)
 
                 # Check if we've reached the target month/year
                 (
@@ -970,42 +1052,7 @@ class MLSCalendarInteractor:
         """
         logger.debug("Parsing month/year text", extra={"text": text})
         try:
-            import re
-
-            # Common patterns for month/year display
-            patterns = [
-                r"(\w+)\s*,?\s*(\d{4})",  # "January 2024" or "January, 2024"
-                r"(\d{1,2})/(\d{4})",  # "01/2024"
-                r"(\d{4})-(\d{1,2})",  # "2024-01"
-            ]
-
-            for i, pattern in enumerate(patterns):
-                match = re.search(pattern, text)
-                if match:
-                    group1, group2 = match.groups()
-
-                    # Handle different patterns
-                    if i == 2:  # "2024-01" pattern - year first, then month
-                        year_str, month_str = group1, group2
-                    else:  # Other patterns - month first, then year
-                        month_str, year_str = group1, group2
-
-                    # Try to parse month
-                    month: Optional[int]
-                    try:
-                        month = int(month_str)
-                    except ValueError:
-                        month = self._parse_month_name(month_str)
-
-                    try:
-                        year = int(year_str)
-                        if month and 1 <= month <= 12:
-                            return month, year
-                    except ValueError:
-                        pass
-
-            return None, None
-
+            return _parse_month_year_cached(text)
         except Exception:
             return None, None
 
@@ -1019,34 +1066,7 @@ class MLSCalendarInteractor:
         Returns:
             Month number (1-12) or None if parsing fails
         """
-        month_names = {
-            "january": 1,
-            "jan": 1,
-            "february": 2,
-            "feb": 2,
-            "march": 3,
-            "mar": 3,
-            "april": 4,
-            "apr": 4,
-            "may": 5,
-            "june": 6,
-            "jun": 6,
-            "july": 7,
-            "jul": 7,
-            "august": 8,
-            "aug": 8,
-            "september": 9,
-            "sep": 9,
-            "sept": 9,
-            "october": 10,
-            "oct": 10,
-            "november": 11,
-            "nov": 11,
-            "december": 12,
-            "dec": 12,
-        }
-
-        return month_names.get(month_str.lower().strip())
+        return self._MONTH_MAP.get(month_str.lower().strip())
 
     async def _navigate_to_year(self, current_year: int, target_year: int) -> bool:
         """
@@ -1086,7 +1106,7 @@ class MLSCalendarInteractor:
                     return True
 
                 # Small delay between clicks
-                await asyncio.sleep(0.3)
+                await _sleep(0.3)
 
             return False
 
@@ -1147,7 +1167,7 @@ class MLSCalendarInteractor:
                     return True
 
                 # Small delay between clicks
-                await asyncio.sleep(0.3)
+                await _sleep(0.3)
 
             return False
 
@@ -1206,7 +1226,7 @@ class MLSCalendarInteractor:
         for _ in range(12):
             if not await self._click_next_month():
                 return False
-            await asyncio.sleep(0.1)  # Small delay between clicks
+            await _sleep(0.1)  # Small delay between clicks
 
         return True
 
@@ -1222,7 +1242,7 @@ class MLSCalendarInteractor:
         for _ in range(12):
             if not await self._click_prev_month():
                 return False
-            await asyncio.sleep(0.1)  # Small delay between clicks
+            await _sleep(0.1)  # Small delay between clicks
 
         return True
 
@@ -6,6 +6,7 @@ dates for web form inputs with proper edge case handling.
 
 import calendar
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 
@@ -108,6 +109,7 @@ def is_holiday(target_date: date) -> bool:
     return False
 
 
+@lru_cache(maxsize=128)
 def _get_last_monday_of_month(year: int, month: int) -> date:
     """Get the last Monday of a given month and year."""
     # Get the last day of the month
@@ -119,6 +121,7 @@ def _get_last_monday_of_month(year: int, month: int) -> date:
     return last_date - timedelta(days=days_back)
 
 
+@lru_cache(maxsize=128)
 def _get_first_monday_of_month(year: int, month: int) -> date:
     """Get the first Monday of a given month and year."""
     first_date = date(year, month, 1)
@@ -126,6 +129,7 @@ def _get_first_monday_of_month(year: int, month: int) -> date:
     return first_date + timedelta(days=days_forward)
 
 
+@lru_cache(maxsize=128)
 def _get_nth_weekday_of_month(
     year: int, month: int, weekday: int, occurrence: int
 ) -> date:
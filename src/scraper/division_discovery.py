@@ -4,6 +4,8 @@ Discovers clubs and teams in a given division by scraping match data
 across all age groups and extracting unique team names.
 """
 
+import asyncio
+from collections import defaultdict
 from datetime import date
 
 from ..models.discovery import DiscoveredClub, DiscoveredTeam
@@ -16,11 +18,24 @@ logger = get_logger()
 # Standard HG age groups on MLS Next
 DISCOVERY_AGE_GROUPS = ["U13", "U14", "U15", "U16", "U17", "U19"]
 
+# Browser sessions discover() runs at once; each one is a Chromium process
+MAX_CONCURRENT_SESSIONS = 3
+
+# Numeric rank of each discovery age group, used as a sort key
+_AGE_GROUP_ORDER = {ag: int(ag[1:]) for ag in DISCOVERY_AGE_GROUPS}
+
 # Full season date range for discovery (cast the widest net)
 SEASON_START = date(2025, 9, 1)
 SEASON_END = date(2026, 6, 30)
 
 
+def _age_group_sort_key(age_group: str) -> int:
+    """Sort key for age groups such as "U14", by their numeric part."""
+    order = _AGE_GROUP_ORDER.get(age_group)
+    # Other valid CLI age groups (e.g. U18) fall back to parsing
+    return order if order is not None else int(age_group[1:])
+
+
 class DivisionDiscoverer:
     """Discovers clubs/teams in a division by scraping all age groups."""
 
@@ -34,38 +49,51 @@ class DivisionDiscoverer:
         self.division = division
         self.league = league
         self.headless = headless
-        self.age_groups = age_groups or DISCOVERY_AGE_GROUPS
+        # Drop repeats (e.g. --age-groups U14,U14) but keep the given order
+        self.age_groups = list(dict.fromkeys(age_groups or DISCOVERY_AGE_GROUPS))
 
     async def discover(self) -> list[DiscoveredClub]:
         """Run discovery across all age groups and return clubs.json-compatible output.
 
-        For each age group, launches a separate browser session to scrape all
-        matches in the division. Team names are collected from both home_team
-        and away_team fields. Results are aggregated into a club list with
+        Each age group is scraped in its own browser session, with up to
+        MAX_CONCURRENT_SESSIONS sessions running at once. If a scrape fails
+        unexpectedly, its error is raised once every session has finished and
+        closed its browser. Team names are collected from both home_team and
+        away_team fields. Results are aggregated into a club list with
         per-club age group coverage.
 
         Returns:
             List of DiscoveredClub objects ready for clubs.json serialization.
         """
-        # team_name -> set of age groups
-        team_age_groups: dict[str, set[str]] = {}
+        logger.info(
+            f"Discovering teams for {', '.join(self.age_groups)} "
+            f"{self.league} {self.division}"
+        )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SESSIONS)
 
-        for age_group in self.age_groups:
-            logger.info(
-                f"Discovering teams for {age_group} {self.league} {self.division}"
-            )
+        async def scrape(age_group: str) -> set[str]:
+            async with semaphore:
+                return await self._scrape_teams_for_age_group(age_group)
 
-            teams = await self._scrape_teams_for_age_group(age_group)
+        results = await asyncio.gather(
+            *(scrape(ag) for ag in self.age_groups), return_exceptions=True
+        )
+        teams_by_age_group: list[set[str]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            teams_by_age_group.append(result)
+
+        # team_name -> age groups; _build_clubs puts them in numeric order
+        team_age_groups: defaultdict[str, list[str]] = defaultdict(list)
+
+        for age_group, teams in zip(self.age_groups, teams_by_age_group):
             for team_name in teams:
-                if team_name not in team_age_groups:
-                    team_age_groups[team_name] = set()
-                team_age_groups[team_name].add(age_group)
+                team_age_groups[team_name].append(age_group)
 
-            logger.info(
-                f"{age_group}: found {len(teams)} unique teams "
-                f"(running total: {len(team_age_groups)} clubs)"
-            )
+            logger.info(f"{age_group}: found {len(teams)} unique teams")
 
+        logger.info(f"Discovered {len(team_age_groups)} clubs")
         return self._build_clubs(team_age_groups)
 
     async def _scrape_teams_for_age_group(self, age_group: str) -> set[str]:
@@ -104,21 +132,17 @@ class DivisionDiscoverer:
         return teams
 
     def _build_clubs(
-        self, team_age_groups: dict[str, set[str]]
+        self, team_age_groups: dict[str, list[str]]
     ) -> list[DiscoveredClub]:
         """Build clubs.json-compatible output from discovered teams.
 
         In HG leagues, team_name == club_name. Each club gets a single team
-        entry with all discovered age groups.
+        entry with all discovered age groups, deduplicated and sorted
+        numerically.
         """
         clubs: list[DiscoveredClub] = []
 
         for team_name in sorted(team_age_groups):
-            age_groups_sorted = sorted(
-                team_age_groups[team_name],
-                key=lambda ag: int(ag[1:]),  # sort by numeric part
-            )
-
             club = DiscoveredClub(
                 club_name=team_name,
                 teams=[
@@ -126,7 +150,10 @@ class DivisionDiscoverer:
                         team_name=team_name,
                         league=self.league,
                         division=self.division,
-                        age_groups=age_groups_sorted,
+                        age_groups=sorted(
+                            set(team_age_groups[team_name]),
+                            key=_age_group_sort_key,
+                        ),
                     )
                 ],
             )
@@ -4,6 +4,8 @@ This module provides functions to look up division IDs based on division
 or conference names for queue message submission.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Optional
 
 # Division ID mappings from MLS Next website (Homegrown Division)
@@ -38,6 +40,10 @@ CONFERENCE_ID_MAP = {
     "California": 42,
 }
 
+# Read-only views handed out by get_all_divisions() / get_all_conferences()
+_DIVISIONS_VIEW = MappingProxyType(DIVISION_ID_MAP)
+_CONFERENCES_VIEW = MappingProxyType(CONFERENCE_ID_MAP)
+
 
 def get_division_id(division: str) -> Optional[int]:
     """
@@ -117,46 +123,40 @@ def get_division_id_for_league(
         >>> get_division_id_for_league("Academy", "Northeast", None)
         41
     """
-    if league == "Academy":
-        # Academy league uses conference
-        if conference:
-            return get_conference_id(conference)
-        # Fallback to division if conference not provided
-        if division:
-            return get_division_id(division)
-    elif league == "Homegrown":
-        # Homegrown league uses division
-        if division:
-            return get_division_id(division)
-
+    # A conference is only looked up among conferences and a division among
+    # divisions, so a name missing from its own map never resolves elsewhere
+    if league == "Academy" and conference:
+        return CONFERENCE_ID_MAP.get(conference)
+    if league in ("Academy", "Homegrown") and division:
+        return DIVISION_ID_MAP.get(division)
     return None
 
 
-def get_all_divisions() -> dict[str, int]:
+def get_all_divisions() -> Mapping[str, int]:
     """
     Get all division name to ID mappings.
 
     Returns:
-        Dictionary of division name -> division ID
+        Read-only mapping of division name -> division ID
 
     Example:
         >>> divisions = get_all_divisions()
         >>> divisions["Northeast"]
         41
     """
-    return DIVISION_ID_MAP.copy()
+    return _DIVISIONS_VIEW
 
 
-def get_all_conferences() -> dict[str, int]:
+def get_all_conferences() -> Mapping[str, int]:
     """
     Get all conference name to ID mappings.
 
     Returns:
-        Dictionary of conference name -> division ID
+        Read-only mapping of conference name -> division ID
 
     Example:
         >>> conferences = get_all_conferences()
         >>> conferences["New England"]
         41
     """
-    return CONFERENCE_ID_MAP.copy()
+    return _CONFERENCES_VIEW
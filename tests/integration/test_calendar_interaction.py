@@ -42,7 +42,6 @@ class TestMLSCalendarInteractor:
 
         return {"page": mock_page, "calendar_widget": calendar_widget}
 
-    @pytest.mark.asyncio
     async def test_open_calendar_widget_success(self, calendar_interactor, mock_page):
         """Test successful calendar widget opening."""
         # Mock ElementInteractor methods
@@ -60,7 +59,6 @@ class TestMLSCalendarInteractor:
             assert result is True
             mock_click.assert_called()
 
-    @pytest.mark.asyncio
     async def test_open_calendar_widget_no_date_field(
         self, calendar_interactor, mock_page
     ):
@@ -79,7 +77,6 @@ class TestMLSCalendarInteractor:
             assert result is False
             mock_click.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_open_calendar_widget_no_calendar_appears(
         self, calendar_interactor, mock_page
     ):
@@ -101,7 +98,6 @@ class TestMLSCalendarInteractor:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_year_same_month(
         self, calendar_interactor, mock_page
     ):
@@ -118,7 +114,6 @@ class TestMLSCalendarInteractor:
 
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_year_different_month(
         self, calendar_interactor, mock_page
     ):
@@ -143,7 +138,6 @@ class TestMLSCalendarInteractor:
             mock_nav_year.assert_called_once_with(2024, 2024)
             mock_nav_month.assert_called_once_with(3, 5)
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_year_different_year(
         self, calendar_interactor, mock_page
     ):
@@ -167,7 +161,6 @@ class TestMLSCalendarInteractor:
             mock_nav_year.assert_called_once_with(2024, 2025)
             mock_nav_month.assert_called_once_with(3, 3)
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_year_navigation_fails(
         self, calendar_interactor, mock_page
     ):
@@ -187,7 +180,6 @@ class TestMLSCalendarInteractor:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_select_date_with_data_attribute(
         self, calendar_interactor, mock_page
     ):
@@ -213,7 +205,6 @@ class TestMLSCalendarInteractor:
             assert result is True
             mock_navigate.assert_called_once_with(target_date)
 
-    @pytest.mark.asyncio
     async def test_select_date_navigation_fails(self, calendar_interactor, mock_page):
         """Test date selection when navigation fails."""
         target_date = date(2024, 3, 15)
@@ -227,7 +218,6 @@ class TestMLSCalendarInteractor:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_select_date_with_element_search(
         self, calendar_interactor, mock_page
     ):
@@ -260,7 +250,6 @@ class TestMLSCalendarInteractor:
             assert result is True
             mock_element.click.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_select_date_range_success(self, calendar_interactor, mock_page):
         """Test successful date range selection."""
         start_date = date(2024, 3, 10)
@@ -276,7 +265,6 @@ class TestMLSCalendarInteractor:
             mock_select.assert_any_call(start_date)
             mock_select.assert_any_call(end_date)
 
-    @pytest.mark.asyncio
     async def test_select_date_range_start_date_fails(
         self, calendar_interactor, mock_page
     ):
@@ -292,7 +280,6 @@ class TestMLSCalendarInteractor:
             assert result is False
             assert mock_select.call_count == 1  # Should stop after first failure
 
-    @pytest.mark.asyncio
     async def test_select_date_range_end_date_fails(
         self, calendar_interactor, mock_page
     ):
@@ -308,7 +295,6 @@ class TestMLSCalendarInteractor:
             assert result is False
             assert mock_select.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_apply_date_filter_success(self, calendar_interactor, mock_page):
         """Test successful date filter application."""
         # Mock ElementInteractor methods
@@ -326,7 +312,6 @@ class TestMLSCalendarInteractor:
             assert result is True
             mock_click.assert_called()
 
-    @pytest.mark.asyncio
     async def test_apply_date_filter_no_button(self, calendar_interactor, mock_page):
         """Test date filter application when no apply button found."""
         # Mock ElementInteractor methods
@@ -343,7 +328,6 @@ class TestMLSCalendarInteractor:
             assert result is False
             mock_click.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_set_date_range_filter_complete_workflow(
         self, calendar_interactor, mock_page
     ):
@@ -368,7 +352,6 @@ class TestMLSCalendarInteractor:
             mock_access.assert_called_once()
             mock_set_range.assert_called_once_with(start_date, end_date)
 
-    @pytest.mark.asyncio
     async def test_set_date_range_filter_open_fails(
         self, calendar_interactor, mock_page
     ):
@@ -384,7 +367,6 @@ class TestMLSCalendarInteractor:
             ):
                 await calendar_interactor.set_date_range_filter(start_date, end_date)
 
-    @pytest.mark.asyncio
     async def test_set_date_range_filter_select_fails(
         self, calendar_interactor, mock_page
     ):
@@ -406,7 +388,6 @@ class TestMLSCalendarInteractor:
             ):
                 await calendar_interactor.set_date_range_filter(start_date, end_date)
 
-    @pytest.mark.asyncio
     async def test_set_date_range_filter_apply_fails(
         self, calendar_interactor, mock_page
     ):
@@ -463,7 +444,6 @@ class TestCalendarNavigationHelpers:
             None,
         )
 
-    @pytest.mark.asyncio
     async def test_get_current_month_year_combined_selector(
         self, calendar_interactor, mock_page
     ):
@@ -482,7 +462,6 @@ class TestCalendarNavigationHelpers:
             assert month == 3
             assert year == 2024
 
-    @pytest.mark.asyncio
     async def test_get_current_month_year_separate_selectors(
         self, calendar_interactor, mock_page
     ):
@@ -498,7 +477,6 @@ class TestCalendarNavigationHelpers:
             assert month == 3
             assert year == 2024
 
-    @pytest.mark.asyncio
     async def test_get_current_month_year_not_found(
         self, calendar_interactor, mock_page
     ):
@@ -513,7 +491,6 @@ class TestCalendarNavigationHelpers:
             assert month is None
             assert year is None
 
-    @pytest.mark.asyncio
     async def test_navigate_to_year_forward(self, calendar_interactor, mock_page):
         """Test navigating forward to future year."""
         with (
@@ -533,7 +510,6 @@ class TestCalendarNavigationHelpers:
             assert result is True
             mock_next_year.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_navigate_to_year_backward(self, calendar_interactor, mock_page):
         """Test navigating backward to past year."""
         with (
@@ -553,7 +529,6 @@ class TestCalendarNavigationHelpers:
             assert result is True
             mock_prev_year.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_forward(self, calendar_interactor, mock_page):
         """Test navigating forward to future month."""
         with (
@@ -573,7 +548,6 @@ class TestCalendarNavigationHelpers:
             assert result is True
             assert mock_next_month.call_count == 2  # March -> April -> May
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_backward(self, calendar_interactor, mock_page):
         """Test navigating backward to past month."""
         with (
@@ -593,7 +567,6 @@ class TestCalendarNavigationHelpers:
             assert result is True
             assert mock_prev_month.call_count == 2  # May -> April -> March
 
-    @pytest.mark.asyncio
     async def test_navigate_to_month_wrap_around(self, calendar_interactor, mock_page):
         """Test navigating with year wrap-around (shortest path)."""
         with (
@@ -613,7 +586,6 @@ class TestCalendarNavigationHelpers:
             # But the mock only shows 1 call because we mock the final state
             assert mock_prev_month.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_click_navigation_buttons(self, calendar_interactor, mock_page):
         """Test clicking navigation buttons."""
         # Mock successful button clicks
@@ -635,7 +607,6 @@ class TestCalendarNavigationHelpers:
                 await calendar_interactor._click_prev_year() is True
             )  # Falls back to month navigation
 
-    @pytest.mark.asyncio
     async def test_navigation_button_not_found(self, calendar_interactor, mock_page):
         """Test navigation when buttons are not found."""
         with patch.object(
@@ -660,7 +631,6 @@ class TestCalendarInteractionErrorHandling:
         """Create MLSCalendarInteractor instance for testing."""
         return MLSCalendarInteractor(mock_page, timeout=5000)
 
-    @pytest.mark.asyncio
     async def test_open_calendar_widget_exception(self, calendar_interactor, mock_page):
         """Test exception handling in calendar widget opening."""
         mock_page.wait_for_selector.side_effect = Exception("Network error")
@@ -669,7 +639,6 @@ class TestCalendarInteractionErrorHandling:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_select_date_exception(self, calendar_interactor, mock_page):
         """Test exception handling in date selection."""
         target_date = date(2024, 3, 15)
@@ -683,7 +652,6 @@ class TestCalendarInteractionErrorHandling:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_apply_date_filter_exception(self, calendar_interactor, mock_page):
         """Test exception handling in filter application."""
         mock_page.wait_for_selector.side_effect = Exception("Button error")
@@ -692,7 +660,6 @@ class TestCalendarInteractionErrorHandling:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_set_date_range_filter_generic_exception(
         self, calendar_interactor, mock_page
     ):
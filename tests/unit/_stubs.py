@@ -0,0 +1,124 @@
+"""
+Lightweight test doubles for Playwright, scraper and console objects.
+
+These stand in for AsyncMock on hot paths where tests only need canned
+results and a record of the calls made.
+"""
+
+from typing import Any
+
+
+class StubPage:
+    """
+    Minimal async stand-in for a Playwright Page.
+
+    Every stubbed method appends ``(args, kwargs)`` to ``calls[name]``. Its
+    result is configured through plain attributes:
+
+    - ``<name>_returns``: value returned on each call
+    - ``<name>_raises``: exception raised on each call
+    - ``<name>_effects``: list consumed one item per call; exceptions are
+      raised and any other item is returned
+    """
+
+    METHODS = (
+        "goto",
+        "wait_for_selector",
+        "click",
+        "fill",
+        "select_option",
+        "text_content",
+        "query_selector_all",
+    )
+
+    def __init__(self) -> None:
+        self.calls: dict[str, list[tuple[tuple, dict]]] = {
+            name: [] for name in self.METHODS
+        }
+        for name in self.METHODS:
+            setattr(self, f"{name}_returns", None)
+            setattr(self, f"{name}_raises", None)
+            setattr(self, f"{name}_effects", None)
+
+    def _call(self, name: str, args: tuple, kwargs: dict) -> Any:
+        self.calls[name].append((args, kwargs))
+
+        effects = getattr(self, f"{name}_effects")
+        if effects:
+            result = effects.pop(0)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        raises = getattr(self, f"{name}_raises")
+        if raises is not None:
+            raise raises
+        return getattr(self, f"{name}_returns")
+
+    async def goto(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("goto", args, kwargs)
+
+    async def wait_for_selector(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("wait_for_selector", args, kwargs)
+
+    async def click(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("click", args, kwargs)
+
+    async def fill(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("fill", args, kwargs)
+
+    async def select_option(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("select_option", args, kwargs)
+
+    async def text_content(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("text_content", args, kwargs)
+
+    async def query_selector_all(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("query_selector_all", args, kwargs)
+
+
+class AsyncReturn:
+    """
+    Async callable that returns a fixed value.
+
+    Cheaper than AsyncMock where a test awaits a method for its result but
+    never inspects how it was called.
+    """
+
+    def __init__(self, value: Any = None) -> None:
+        self.value = value
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.value
+
+
+class StubScraper:
+    """
+    Minimal async stand-in for MLSScraper.
+
+    ``scrape_matches()`` returns ``result``, or raises it when it is an
+    exception.
+    """
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    async def scrape_matches(self, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+
+class ConsoleSpy:
+    """
+    Stand-in for a Rich Console that records printed messages.
+
+    Each ``print()`` call appends its positional arguments, joined by spaces,
+    to ``messages``.
+    """
+
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def print(self, *args: Any, **kwargs: Any) -> None:
+        self.messages.append(" ".join(str(arg) for arg in args))
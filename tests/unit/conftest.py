@@ -0,0 +1,66 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from typer.testing import CliRunner
+
+FROZEN_TODAY = date(2024, 6, 15)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CLI runner shared by the command tests in a module."""
+    return CliRunner(env={"NO_COLOR": "1"})
+
+
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """
+    Pin date.today() in the date handler and return the pinned date.
+
+    load_config() and calculate_date_range() both resolve "today" there, so
+    expected dates no longer depend on when (or across which midnight) the
+    test runs.
+    """
+    from src.scraper import date_handler
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return FROZEN_TODAY
+
+    monkeypatch.setattr(date_handler, "date", FrozenDate)
+    return FROZEN_TODAY
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_browser_manager():
+    """
+    Initialize a single BrowserManager for the whole test session.
+
+    Playwright is mocked so the manager starts once without launching a real
+    browser; tests that only need an initialized manager reuse this instance.
+    """
+    from src.scraper.browser import BrowserManager
+
+    mock_playwright = AsyncMock()
+    mock_browser = AsyncMock()
+    mock_context = AsyncMock()
+    mock_playwright.chromium.launch.return_value = mock_browser
+    mock_browser.new_context.return_value = mock_context
+
+    with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright
+        )
+        manager = BrowserManager()
+        await manager.initialize()
+
+    yield manager
+
+    await manager.cleanup()
@@ -5,9 +5,12 @@ Tests browser initialization, page navigation, element interaction,
 and resource cleanup with mocked Playwright interactions.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, create_autospec, patch
 
 import pytest
+import pytest_asyncio
+from playwright.async_api import Browser, BrowserContext
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.scraper.browser import (
@@ -17,6 +20,11 @@ from src.scraper.browser import (
     PageNavigator,
     get_browser_manager,
 )
+from tests.unit._stubs import StubPage
+
+# Error instances reused by side effects; raising the same object is fine
+_TIMEOUT = PlaywrightTimeoutError("Timeout")
+_GENERIC_ERR = Exception("Network error")
 
 
 class TestBrowserConfig:
@@ -50,6 +58,27 @@ class TestBrowserConfig:
         assert config.user_agent == "Custom User Agent"
 
 
+@pytest.fixture(scope="module")
+def mock_playwright():
+    """Create mock Playwright objects once and share them across the module."""
+    # Playwright.chromium is a property that autospec cannot follow
+    mock_playwright = AsyncMock()
+    mock_browser = create_autospec(Browser, instance=True)
+    mock_context = create_autospec(BrowserContext, instance=True)
+    mock_playwright_instance = AsyncMock()
+
+    mock_playwright.chromium.launch.return_value = mock_browser
+    mock_browser.new_context.return_value = mock_context
+    mock_playwright_instance.start.return_value = mock_playwright
+
+    return {
+        "playwright": mock_playwright,
+        "browser": mock_browser,
+        "context": mock_context,
+        "instance": mock_playwright_instance,
+    }
+
+
 class TestBrowserManager:
     """Test BrowserManager class."""
 
@@ -58,83 +87,87 @@ class TestBrowserManager:
         """Create BrowserManager instance for testing."""
         return BrowserManager()
 
-    @pytest.fixture
-    def mock_playwright(self):
-        """Create mock Playwright objects."""
-        mock_playwright = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-
-        mock_playwright.chromium.launch.return_value = mock_browser
-        mock_browser.new_context.return_value = mock_context
+    @pytest.fixture(autouse=True)
+    def reset_mock_playwright(self, mock_playwright):
+        """Clear recorded calls and side effects left by the previous test."""
+        for mock in mock_playwright.values():
+            mock.reset_mock(side_effect=True)
+
+    @pytest.fixture(autouse=True)
+    def patch_async_playwright(self, mock_playwright, monkeypatch):
+        """Route async_playwright() to the shared mock Playwright instance."""
+        monkeypatch.setattr(
+            "src.scraper.browser.async_playwright",
+            lambda: mock_playwright["instance"],
+        )
 
-        return {
-            "playwright": mock_playwright,
-            "browser": mock_browser,
-            "context": mock_context,
-        }
+    @pytest_asyncio.fixture
+    async def initialized_browser_manager(self, browser_manager, mock_playwright):
+        """Initialize a fresh BrowserManager against the mocked Playwright."""
+        await browser_manager.initialize()
+        return browser_manager, mock_playwright
 
     @pytest.mark.asyncio
-    async def test_initialize_success(self, browser_manager, mock_playwright):
-        """Test successful browser initialization."""
-        with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
-            # Mock the async_playwright() call to return an object with start() method
-            mock_playwright_instance = AsyncMock()
-            mock_playwright_instance.start.return_value = mock_playwright["playwright"]
-            mock_async_playwright.return_value = mock_playwright_instance
+    async def test_initialize_starts_playwright(self, browser_manager, mock_playwright):
+        """Test initialization starts Playwright."""
+        await browser_manager.initialize()
 
-            await browser_manager.initialize()
+        mock_playwright["instance"].start.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_initialize_launches_chromium_with_sandbox_args(
+        self, browser_manager, mock_playwright
+    ):
+        """Test Chromium is launched headless with sandboxing disabled."""
+        await browser_manager.initialize()
+
+        mock_playwright["playwright"].chromium.launch.assert_called_once()
+        launch_args = mock_playwright["playwright"].chromium.launch.call_args
+        assert launch_args.kwargs["headless"] is True
+        assert {"--no-sandbox", "--disable-setuid-sandbox"} <= set(
+            launch_args.kwargs["args"]
+        )
 
-            # Verify Playwright was started
-            mock_async_playwright.return_value.start.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_initialize_creates_context_with_viewport(
+        self, browser_manager, mock_playwright
+    ):
+        """Test the browser context is created with the default viewport."""
+        await browser_manager.initialize()
 
-            # Verify browser was launched with correct args
-            mock_playwright["playwright"].chromium.launch.assert_called_once()
-            launch_args = mock_playwright["playwright"].chromium.launch.call_args
-            assert launch_args.kwargs["headless"] is True
-            assert "--no-sandbox" in launch_args.kwargs["args"]
-            assert "--disable-setuid-sandbox" in launch_args.kwargs["args"]
+        mock_playwright["browser"].new_context.assert_called_once()
+        context_args = mock_playwright["browser"].new_context.call_args
+        assert context_args.kwargs["viewport"] == {"width": 1280, "height": 720}
 
-            # Verify context was created
-            mock_playwright["browser"].new_context.assert_called_once()
-            context_args = mock_playwright["browser"].new_context.call_args
-            assert context_args.kwargs["viewport"]["width"] == 1280
-            assert context_args.kwargs["viewport"]["height"] == 720
+    @pytest.mark.asyncio
+    async def test_initialize_sets_timeout(self, browser_manager, mock_playwright):
+        """Test the configured timeout is applied to the browser context."""
+        await browser_manager.initialize()
 
-            # Verify timeout was set
-            mock_playwright["context"].set_default_timeout.assert_called_once_with(
-                30000
-            )
+        mock_playwright["context"].set_default_timeout.assert_called_once_with(30000)
 
     @pytest.mark.asyncio
-    async def test_initialize_failure(self, browser_manager):
+    async def test_initialize_failure(self, browser_manager, mock_playwright):
         """Test browser initialization failure."""
-        with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright_instance.start.side_effect = Exception(
-                "Browser launch failed"
-            )
-            mock_async_playwright.return_value = mock_playwright_instance
+        mock_playwright["instance"].start.side_effect = Exception(
+            "Browser launch failed"
+        )
 
-            with pytest.raises(Exception, match="Browser launch failed"):
-                await browser_manager.initialize()
+        with pytest.raises(Exception, match="Browser launch failed"):
+            await browser_manager.initialize()
 
     @pytest.mark.asyncio
-    async def test_new_page_success(self, browser_manager, mock_playwright):
+    async def test_new_page_success(self, shared_browser_manager):
         """Test successful page creation."""
         mock_page = AsyncMock()
-        mock_playwright["context"].new_page.return_value = mock_page
+        mock_context = shared_browser_manager._context
+        mock_context.new_page.reset_mock()
+        mock_context.new_page.return_value = mock_page
 
-        with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright_instance.start.return_value = mock_playwright["playwright"]
-            mock_async_playwright.return_value = mock_playwright_instance
+        page = await shared_browser_manager.new_page()
 
-            await browser_manager.initialize()
-            page = await browser_manager.new_page()
-
-            assert page == mock_page
-            mock_playwright["context"].new_page.assert_called_once()
+        assert page == mock_page
+        mock_context.new_page.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_new_page_not_initialized(self, browser_manager):
@@ -143,53 +176,37 @@ class TestBrowserManager:
             await browser_manager.new_page()
 
     @pytest.mark.asyncio
-    async def test_cleanup_success(self, browser_manager, mock_playwright):
+    async def test_cleanup_success(self, initialized_browser_manager):
         """Test successful browser cleanup."""
-        with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright_instance.start.return_value = mock_playwright["playwright"]
-            mock_async_playwright.return_value = mock_playwright_instance
+        browser_manager, mock_playwright = initialized_browser_manager
 
-            await browser_manager.initialize()
-            await browser_manager.cleanup()
+        await browser_manager.cleanup()
 
-            # Verify cleanup order
-            mock_playwright["context"].close.assert_called_once()
-            mock_playwright["browser"].close.assert_called_once()
-            mock_playwright["playwright"].stop.assert_called_once()
+        # Verify cleanup order
+        mock_playwright["context"].close.assert_called_once()
+        mock_playwright["browser"].close.assert_called_once()
+        mock_playwright["playwright"].stop.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_cleanup_with_errors(self, browser_manager, mock_playwright):
+    async def test_cleanup_with_errors(self, initialized_browser_manager):
         """Test cleanup with errors (should not raise)."""
+        browser_manager, mock_playwright = initialized_browser_manager
         mock_playwright["context"].close.side_effect = Exception("Context close error")
 
-        with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright_instance.start.return_value = mock_playwright["playwright"]
-            mock_async_playwright.return_value = mock_playwright_instance
-
-            await browser_manager.initialize()
-            # Should not raise exception
-            await browser_manager.cleanup()
+        # Should not raise exception
+        await browser_manager.cleanup()
 
     @pytest.mark.asyncio
-    async def test_get_page_context_manager(self, browser_manager, mock_playwright):
+    async def test_get_page_context_manager(self, shared_browser_manager):
         """Test page context manager."""
         mock_page = AsyncMock()
-        mock_playwright["context"].new_page.return_value = mock_page
+        shared_browser_manager._context.new_page.return_value = mock_page
 
-        with patch("src.scraper.browser.async_playwright") as mock_async_playwright:
-            mock_playwright_instance = AsyncMock()
-            mock_playwright_instance.start.return_value = mock_playwright["playwright"]
-            mock_async_playwright.return_value = mock_playwright_instance
-
-            await browser_manager.initialize()
-
-            async with browser_manager.get_page() as page:
-                assert page == mock_page
+        async with shared_browser_manager.get_page() as page:
+            assert page == mock_page
 
-            # Verify page was closed
-            mock_page.close.assert_called_once()
+        # Verify page was closed
+        mock_page.close.assert_called_once()
 
 
 class TestPageNavigator:
@@ -197,49 +214,45 @@ class TestPageNavigator:
 
     @pytest.fixture
     def mock_page(self):
-        """Create mock page for testing."""
-        return AsyncMock()
+        """Create stub page for testing."""
+        return StubPage()
 
     @pytest.fixture
     def navigator(self, mock_page):
-        """Create PageNavigator instance for testing."""
-        return PageNavigator(mock_page, max_retries=2, retry_delay=0.1)
+        """Create PageNavigator instance for testing, retrying without delay."""
+        return PageNavigator(mock_page, max_retries=2, retry_delay=0)
 
     @pytest.mark.asyncio
     async def test_navigate_success(self, navigator, mock_page):
         """Test successful navigation."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status = 200
-        mock_page.goto.return_value = mock_response
+        mock_response = SimpleNamespace(ok=True, status=200)
+        mock_page.goto_returns = mock_response
 
         result = await navigator.navigate_to("https://example.com")
 
         assert result is True
-        mock_page.goto.assert_called_once_with(
-            "https://example.com", wait_until="networkidle"
-        )
+        assert mock_page.calls["goto"] == [
+            (("https://example.com",), {"wait_until": "networkidle"})
+        ]
 
     @pytest.mark.asyncio
     async def test_navigate_custom_wait_until(self, navigator, mock_page):
         """Test navigation with custom wait_until."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status = 200
-        mock_page.goto.return_value = mock_response
+        mock_response = SimpleNamespace(ok=True, status=200)
+        mock_page.goto_returns = mock_response
 
         result = await navigator.navigate_to("https://example.com", wait_until="load")
 
         assert result is True
-        mock_page.goto.assert_called_once_with("https://example.com", wait_until="load")
+        assert mock_page.calls["goto"] == [
+            (("https://example.com",), {"wait_until": "load"})
+        ]
 
     @pytest.mark.asyncio
     async def test_navigate_non_ok_response(self, navigator, mock_page):
         """Test navigation with non-OK response."""
-        mock_response = MagicMock()
-        mock_response.ok = False
-        mock_response.status = 404
-        mock_page.goto.return_value = mock_response
+        mock_response = SimpleNamespace(ok=False, status=404)
+        mock_page.goto_returns = mock_response
 
         result = await navigator.navigate_to("https://example.com")
 
@@ -248,39 +261,132 @@ class TestPageNavigator:
     @pytest.mark.asyncio
     async def test_navigate_timeout_with_retry(self, navigator, mock_page):
         """Test navigation timeout with retry logic."""
-        mock_page.goto.side_effect = [
-            PlaywrightTimeoutError("Timeout"),
-            PlaywrightTimeoutError("Timeout"),
-            MagicMock(ok=True, status=200),
+        mock_page.goto_effects = [
+            _TIMEOUT,
+            _TIMEOUT,
+            SimpleNamespace(ok=True, status=200),
         ]
 
         result = await navigator.navigate_to("https://example.com")
 
         assert result is True
-        assert mock_page.goto.call_count == 3
+        assert len(mock_page.calls["goto"]) == 3
 
     @pytest.mark.asyncio
     async def test_navigate_max_retries_exceeded(self, navigator, mock_page):
         """Test navigation failing after max retries."""
-        mock_page.goto.side_effect = PlaywrightTimeoutError("Timeout")
+        mock_page.goto_raises = _TIMEOUT
 
         result = await navigator.navigate_to("https://example.com")
 
         assert result is False
-        assert mock_page.goto.call_count == 3  # Initial + 2 retries
+        assert len(mock_page.calls["goto"]) == 3  # Initial + 2 retries
 
     @pytest.mark.asyncio
     async def test_navigate_exception_with_retry(self, navigator, mock_page):
         """Test navigation exception with retry logic."""
-        mock_page.goto.side_effect = [
-            Exception("Network error"),
-            MagicMock(ok=True, status=200),
+        mock_page.goto_effects = [
+            _GENERIC_ERR,
+            SimpleNamespace(ok=True, status=200),
         ]
 
         result = await navigator.navigate_to("https://example.com")
 
         assert result is True
-        assert mock_page.goto.call_count == 2
+        assert len(mock_page.calls["goto"]) == 2
+
+
+INTERACTOR_CASES = [
+    pytest.param(
+        "wait_for_element",
+        ("#test-element",),
+        {},
+        True,
+        {
+            "wait_for_selector": [
+                (("#test-element",), {"timeout": 5000, "state": "visible"})
+            ]
+        },
+        id="wait_for_element-success",
+    ),
+    pytest.param(
+        "wait_for_element",
+        ("#test-element",),
+        {"wait_for_selector_raises": _TIMEOUT},
+        False,
+        {},
+        id="wait_for_element-timeout",
+    ),
+    pytest.param(
+        "click_element",
+        ("#test-button",),
+        {},
+        True,
+        {"click": [(("#test-button",), {"timeout": 5000, "force": False})]},
+        id="click_element-success",
+    ),
+    pytest.param(
+        "click_element",
+        ("#test-button",),
+        {"wait_for_selector_raises": _TIMEOUT},
+        False,
+        {"click": []},
+        id="click_element-not-found",
+    ),
+    pytest.param(
+        "fill_input",
+        ("#test-input", "test value"),
+        {},
+        True,
+        {
+            "fill": [
+                (("#test-input", ""), {}),  # Clear first
+                (("#test-input", "test value"), {"timeout": 5000}),
+            ]
+        },
+        id="fill_input-success",
+    ),
+    pytest.param(
+        "fill_input",
+        ("#test-input", "test value"),
+        {"wait_for_selector_raises": _TIMEOUT},
+        False,
+        {"fill": []},
+        id="fill_input-not-found",
+    ),
+    pytest.param(
+        "select_dropdown_option",
+        ("#test-select", "option1"),
+        {},
+        True,
+        {"select_option": [(("#test-select", "option1"), {"timeout": 5000})]},
+        id="select_dropdown_option-success",
+    ),
+    pytest.param(
+        "select_dropdown_option",
+        ("#test-select", "option1"),
+        {"wait_for_selector_raises": _TIMEOUT},
+        False,
+        {"select_option": []},
+        id="select_dropdown_option-not-found",
+    ),
+    pytest.param(
+        "get_text_content",
+        ("#test-element",),
+        {"text_content_returns": "Test content"},
+        "Test content",
+        {"text_content": [(("#test-element",), {"timeout": 5000})]},
+        id="get_text_content-success",
+    ),
+    pytest.param(
+        "get_text_content",
+        ("#test-element",),
+        {"wait_for_selector_raises": _TIMEOUT},
+        None,
+        {"text_content": []},
+        id="get_text_content-not-found",
+    ),
+]
 
 
 class TestElementInteractor:
@@ -288,8 +394,8 @@ class TestElementInteractor:
 
     @pytest.fixture
     def mock_page(self):
-        """Create mock page for testing."""
-        return AsyncMock()
+        """Create stub page for testing."""
+        return StubPage()
 
     @pytest.fixture
     def interactor(self, mock_page):
@@ -297,152 +403,67 @@ class TestElementInteractor:
         return ElementInteractor(mock_page, default_timeout=5000)
 
     @pytest.mark.asyncio
-    async def test_wait_for_element_success(self, interactor, mock_page):
-        """Test successful element waiting."""
-        mock_page.wait_for_selector.return_value = None
-
-        result = await interactor.wait_for_element("#test-element")
-
-        assert result is True
-        mock_page.wait_for_selector.assert_called_once_with(
-            "#test-element", timeout=5000, state="visible"
-        )
-
-    @pytest.mark.asyncio
-    async def test_wait_for_element_timeout(self, interactor, mock_page):
-        """Test element waiting timeout."""
-        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
-
-        result = await interactor.wait_for_element("#test-element")
-
-        assert result is False
+    @pytest.mark.parametrize(
+        "method,args,page_setup,expected,expected_calls", INTERACTOR_CASES
+    )
+    async def test_interactor(
+        self, interactor, mock_page, method, args, page_setup, expected, expected_calls
+    ):
+        """Test interactor methods for found and missing elements."""
+        for attr, value in page_setup.items():
+            setattr(mock_page, attr, value)
+
+        result = await getattr(interactor, method)(*args)
+
+        assert result == expected
+        for name, calls in expected_calls.items():
+            assert mock_page.calls[name] == calls
 
     @pytest.mark.asyncio
     async def test_wait_for_element_custom_params(self, interactor, mock_page):
         """Test element waiting with custom parameters."""
-        mock_page.wait_for_selector.return_value = None
-
         result = await interactor.wait_for_element(
             "#test-element", timeout=10000, state="attached"
         )
 
         assert result is True
-        mock_page.wait_for_selector.assert_called_once_with(
-            "#test-element", timeout=10000, state="attached"
-        )
-
-    @pytest.mark.asyncio
-    async def test_click_element_success(self, interactor, mock_page):
-        """Test successful element clicking."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.click.return_value = None
-
-        result = await interactor.click_element("#test-button")
-
-        assert result is True
-        mock_page.wait_for_selector.assert_called_once()
-        mock_page.click.assert_called_once_with(
-            "#test-button", timeout=5000, force=False
-        )
-
-    @pytest.mark.asyncio
-    async def test_click_element_not_found(self, interactor, mock_page):
-        """Test clicking element that's not found."""
-        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
-
-        result = await interactor.click_element("#test-button")
-
-        assert result is False
-        mock_page.click.assert_not_called()
+        assert mock_page.calls["wait_for_selector"] == [
+            (("#test-element",), {"timeout": 10000, "state": "attached"})
+        ]
 
     @pytest.mark.asyncio
     async def test_click_element_force(self, interactor, mock_page):
         """Test force clicking element."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.click.return_value = None
-
         result = await interactor.click_element("#test-button", force=True)
 
         assert result is True
-        mock_page.click.assert_called_once_with(
-            "#test-button", timeout=5000, force=True
-        )
-
-    @pytest.mark.asyncio
-    async def test_fill_input_success(self, interactor, mock_page):
-        """Test successful input filling."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.fill.return_value = None
-
-        result = await interactor.fill_input("#test-input", "test value")
-
-        assert result is True
-        mock_page.fill.assert_any_call("#test-input", "")  # Clear first
-        mock_page.fill.assert_any_call("#test-input", "test value", timeout=5000)
+        assert mock_page.calls["click"] == [
+            (("#test-button",), {"timeout": 5000, "force": True})
+        ]
 
     @pytest.mark.asyncio
     async def test_fill_input_no_clear(self, interactor, mock_page):
         """Test input filling without clearing first."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.fill.return_value = None
-
         result = await interactor.fill_input(
             "#test-input", "test value", clear_first=False
         )
 
         assert result is True
         # Should only be called once (not clearing first)
-        mock_page.fill.assert_called_once_with(
-            "#test-input", "test value", timeout=5000
-        )
-
-    @pytest.mark.asyncio
-    async def test_select_dropdown_option_success(self, interactor, mock_page):
-        """Test successful dropdown selection."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.select_option.return_value = None
-
-        result = await interactor.select_dropdown_option("#test-select", "option1")
-
-        assert result is True
-        mock_page.select_option.assert_called_once_with(
-            "#test-select", "option1", timeout=5000
-        )
+        assert mock_page.calls["fill"] == [
+            (("#test-input", "test value"), {"timeout": 5000})
+        ]
 
     @pytest.mark.asyncio
     async def test_select_dropdown_multiple_options(self, interactor, mock_page):
         """Test dropdown selection with multiple options."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.select_option.return_value = None
-
         options = ["option1", "option2"]
         result = await interactor.select_dropdown_option("#test-select", options)
 
         assert result is True
-        mock_page.select_option.assert_called_once_with(
-            "#test-select", options, timeout=5000
-        )
-
-    @pytest.mark.asyncio
-    async def test_get_text_content_success(self, interactor, mock_page):
-        """Test successful text content retrieval."""
-        mock_page.wait_for_selector.return_value = None
-        mock_page.text_content.return_value = "Test content"
-
-        result = await interactor.get_text_content("#test-element")
-
-        assert result == "Test content"
-        mock_page.text_content.assert_called_once_with("#test-element", timeout=5000)
-
-    @pytest.mark.asyncio
-    async def test_get_text_content_not_found(self, interactor, mock_page):
-        """Test text content retrieval when element not found."""
-        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
-
-        result = await interactor.get_text_content("#test-element")
-
-        assert result is None
-        mock_page.text_content.assert_not_called()
+        assert mock_page.calls["select_option"] == [
+            (("#test-select", options), {"timeout": 5000})
+        ]
 
     @pytest.mark.asyncio
     async def test_get_elements_text_success(self, interactor, mock_page):
@@ -454,8 +475,7 @@ class TestElementInteractor:
         mock_element3 = AsyncMock()
         mock_element3.text_content.return_value = None
 
-        mock_page.wait_for_selector.return_value = None
-        mock_page.query_selector_all.return_value = [
+        mock_page.query_selector_all_returns = [
             mock_element1,
             mock_element2,
             mock_element3,
@@ -464,61 +484,60 @@ class TestElementInteractor:
         result = await interactor.get_elements_text(".test-elements")
 
         assert result == ["Text 1", "Text 2"]  # Stripped and filtered
-        mock_page.query_selector_all.assert_called_once_with(".test-elements")
+        assert mock_page.calls["query_selector_all"] == [((".test-elements",), {})]
 
     @pytest.mark.asyncio
     async def test_get_elements_text_no_elements(self, interactor, mock_page):
         """Test multiple elements text retrieval when no elements found."""
-        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
+        mock_page.wait_for_selector_raises = _TIMEOUT
 
         result = await interactor.get_elements_text(".test-elements")
 
         assert result == []
-        mock_page.query_selector_all.assert_not_called()
+        assert mock_page.calls["query_selector_all"] == []
 
 
 class TestGetBrowserManager:
     """Test get_browser_manager context manager."""
 
+    @pytest.fixture
+    def patched_browser_manager(self):
+        """Patch BrowserManager so get_browser_manager yields a mock manager."""
+        with patch("src.scraper.browser.BrowserManager") as MockBrowserManager:
+            MockBrowserManager.return_value = AsyncMock()
+            yield MockBrowserManager
+
     @pytest.mark.asyncio
-    async def test_context_manager_success(self):
+    async def test_context_manager_success(self, patched_browser_manager):
         """Test successful context manager usage."""
-        with patch("src.scraper.browser.BrowserManager") as MockBrowserManager:
-            mock_manager = AsyncMock()
-            MockBrowserManager.return_value = mock_manager
+        mock_manager = patched_browser_manager.return_value
 
-            async with get_browser_manager() as browser_manager:
-                assert browser_manager == mock_manager
+        async with get_browser_manager() as browser_manager:
+            assert browser_manager == mock_manager
 
-            # Verify initialization and cleanup were called
-            mock_manager.initialize.assert_called_once()
-            mock_manager.cleanup.assert_called_once()
+        # Verify initialization and cleanup were called
+        mock_manager.initialize.assert_called_once()
+        mock_manager.cleanup.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_context_manager_with_config(self):
+    async def test_context_manager_with_config(self, patched_browser_manager):
         """Test context manager with custom config."""
         config = BrowserConfig(headless=False)
 
-        with patch("src.scraper.browser.BrowserManager") as MockBrowserManager:
-            mock_manager = AsyncMock()
-            MockBrowserManager.return_value = mock_manager
+        async with get_browser_manager(config) as browser_manager:
+            assert browser_manager == patched_browser_manager.return_value
 
-            async with get_browser_manager(config) as browser_manager:
-                assert browser_manager == mock_manager
-
-            # Verify manager was created with config
-            MockBrowserManager.assert_called_once_with(config)
+        # Verify manager was created with config
+        patched_browser_manager.assert_called_once_with(config)
 
     @pytest.mark.asyncio
-    async def test_context_manager_cleanup_on_exception(self):
+    async def test_context_manager_cleanup_on_exception(self, patched_browser_manager):
         """Test context manager cleanup when exception occurs."""
-        with patch("src.scraper.browser.BrowserManager") as MockBrowserManager:
-            mock_manager = AsyncMock()
-            MockBrowserManager.return_value = mock_manager
+        mock_manager = patched_browser_manager.return_value
 
-            with pytest.raises(ValueError):
-                async with get_browser_manager():
-                    raise ValueError("Test exception")
+        with pytest.raises(ValueError):
+            async with get_browser_manager():
+                raise ValueError("Test exception")
 
-            # Verify cleanup was still called
-            mock_manager.cleanup.assert_called_once()
+        # Verify cleanup was still called
+        mock_manager.cleanup.assert_called_once()
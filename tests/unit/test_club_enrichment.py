@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from src.cli.main import app
 from src.models.discovery import DiscoveredClub, DiscoveredTeam
 from src.scraper.club_enrichment import (
     ClubEnricher,
@@ -456,15 +457,11 @@ class TestEnrichCLI:
         self.runner = CliRunner(env={"NO_COLOR": "1"})
 
     def test_enrich_missing_input(self):
-        from src.cli.main import app
-
         result = self.runner.invoke(app, ["enrich", "--input", "nonexistent.json"])
         assert result.exit_code == 1
         assert "not found" in result.output
 
     def test_enrich_empty_clubs(self):
-        from src.cli.main import app
-
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w") as f:
             json.dump([], f)
             tmp_path = f.name
@@ -477,8 +474,6 @@ class TestEnrichCLI:
             os.unlink(tmp_path)
 
     def test_enrich_success(self):
-        from src.cli.main import app
-
         clubs_data = [
             {
                 "club_name": "Test FC",
@@ -543,8 +538,6 @@ class TestEnrichCLI:
             os.unlink(output_path)
 
     def test_enrich_malformed_json(self):
-        from src.cli.main import app
-
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w") as f:
             f.write("not valid json {{{")
             tmp_path = f.name
@@ -557,8 +550,6 @@ class TestEnrichCLI:
             os.unlink(tmp_path)
 
     def test_enrich_shows_manual_count(self):
-        from src.cli.main import app
-
         clubs_data = [
             {
                 "club_name": "Missing FC",
@@ -597,8 +588,6 @@ class TestEnrichCLI:
             os.unlink(output_path)
 
     def test_enrich_shows_errors(self):
-        from src.cli.main import app
-
         clubs_data = [
             {
                 "club_name": "Error FC",
@@ -643,8 +632,6 @@ class TestEnrichCLI:
             os.unlink(output_path)
 
     def test_enrich_exception_from_enricher(self):
-        from src.cli.main import app
-
         clubs_data = [
             {
                 "club_name": "Crash FC",
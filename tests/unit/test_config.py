@@ -1,7 +1,7 @@
 """Unit tests for configuration module."""
 
 import os
-from datetime import date, timedelta
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
@@ -9,18 +9,19 @@ from pydantic import ValidationError
 
 from src.scraper.config import ScrapingConfig, load_config
 
+# Required API settings shared by the load_config tests
+_BASE_ENV = {
+    "MISSING_TABLE_API_URL": "https://api.example.com",
+    "MISSING_TABLE_API_KEY": "test-key",
+}
+
 
 class TestLoadConfig:
     """Test configuration loading from environment variables."""
 
-    def test_load_config_with_defaults(self):
+    def test_load_config_with_defaults(self, frozen_today):
         """Test loading configuration with default values."""
-        env_vars = {
-            "MISSING_TABLE_API_URL": "https://api.missing-table.com",
-            "MISSING_TABLE_API_KEY": "test-api-key",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
+        with patch.dict(os.environ, _BASE_ENV, clear=True):
             config = load_config()
 
         assert config.age_group == "U14"
@@ -29,16 +30,14 @@ class TestLoadConfig:
         assert config.division == "Northeast"
         assert config.look_back_days == 1
         assert config.log_level == "INFO"
-        assert config.missing_table_api_url == "https://api.missing-table.com"
-        assert config.missing_table_api_key == "test-api-key"
+        assert config.missing_table_api_url == "https://api.example.com"
+        assert config.missing_table_api_key == "test-key"
 
         # Check date calculations
-        expected_end_date = date.today()
-        expected_start_date = expected_end_date - timedelta(days=1)
-        assert config.end_date == expected_end_date
-        assert config.start_date == expected_start_date
+        assert config.end_date == frozen_today
+        assert config.start_date == frozen_today - timedelta(days=1)
 
-    def test_load_config_with_custom_values(self):
+    def test_load_config_with_custom_values(self, frozen_today):
         """Test loading configuration with custom environment variables."""
         env_vars = {
             "AGE_GROUP": "U16",
@@ -68,10 +67,8 @@ class TestLoadConfig:
         assert config.otel_service_name == "custom-scraper"
 
         # Check date calculations with custom look_back_days
-        expected_end_date = date.today()
-        expected_start_date = expected_end_date - timedelta(days=7)
-        assert config.end_date == expected_end_date
-        assert config.start_date == expected_start_date
+        assert config.end_date == frozen_today
+        assert config.start_date == frozen_today - timedelta(days=7)
 
     def test_load_config_missing_required_api_url(self):
         """Test that missing API URL raises ValueError."""
@@ -101,11 +98,7 @@ class TestLoadConfig:
 
     def test_load_config_invalid_look_back_days_string(self):
         """Test that invalid look_back_days string raises ValueError."""
-        env_vars = {
-            "MISSING_TABLE_API_URL": "https://api.example.com",
-            "MISSING_TABLE_API_KEY": "test-key",
-            "LOOK_BACK_DAYS": "invalid",
-        }
+        env_vars = {**_BASE_ENV, "LOOK_BACK_DAYS": "invalid"}
 
         with patch.dict(os.environ, env_vars, clear=True):
             with pytest.raises(
@@ -115,11 +108,7 @@ class TestLoadConfig:
 
     def test_load_config_negative_look_back_days(self):
         """Test that negative look_back_days raises ValueError."""
-        env_vars = {
-            "MISSING_TABLE_API_URL": "https://api.example.com",
-            "MISSING_TABLE_API_KEY": "test-key",
-            "LOOK_BACK_DAYS": "-1",
-        }
+        env_vars = {**_BASE_ENV, "LOOK_BACK_DAYS": "-1"}
 
         with patch.dict(os.environ, env_vars, clear=True):
             with pytest.raises(ValueError, match="LOOK_BACK_DAYS must be non-negative"):
@@ -127,11 +116,7 @@ class TestLoadConfig:
 
     def test_load_config_zero_look_back_days(self):
         """Test that zero look_back_days is valid."""
-        env_vars = {
-            "MISSING_TABLE_API_URL": "https://api.example.com",
-            "MISSING_TABLE_API_KEY": "test-key",
-            "LOOK_BACK_DAYS": "0",
-        }
+        env_vars = {**_BASE_ENV, "LOOK_BACK_DAYS": "0"}
 
         with patch.dict(os.environ, env_vars, clear=True):
             config = load_config()
@@ -143,122 +128,77 @@ class TestLoadConfig:
 class TestValidateConfig:
     """Test configuration validation."""
 
-    def test_validate_config_valid(self):
+    @pytest.fixture
+    def valid_config_kwargs(self, frozen_today):
+        """Keyword arguments for a valid ScrapingConfig, to override per test."""
+        return {
+            "age_group": "U14",
+            "club": "",
+            "competition": "",
+            "division": "Northeast",
+            "look_back_days": 1,
+            "start_date": frozen_today - timedelta(days=1),
+            "end_date": frozen_today,
+            "missing_table_api_url": "https://api.example.com",
+            "missing_table_api_key": "test-key",
+            "log_level": "INFO",
+        }
+
+    def test_validate_config_valid(self, valid_config_kwargs):
         """Test validation with valid configuration."""
         # Should not raise any exception during creation
         config = ScrapingConfig(
-            age_group="U14",
-            club="Test Club",
-            competition="Test Competition",
-            division="Northeast",
-            look_back_days=1,
-            start_date=date.today() - timedelta(days=1),
-            end_date=date.today(),
-            missing_table_api_url="https://api.example.com",
-            missing_table_api_key="test-key",
-            log_level="INFO",
+            **{
+                **valid_config_kwargs,
+                "club": "Test Club",
+                "competition": "Test Competition",
+            }
         )
         assert config.age_group == "U14"
 
-    def test_validate_config_invalid_age_group(self):
+    def test_validate_config_invalid_age_group(self, valid_config_kwargs):
         """Test validation with invalid age group."""
         with pytest.raises(ValidationError, match="Invalid age_group: U12"):
-            ScrapingConfig(
-                age_group="U12",  # Invalid age group
-                club="",
-                competition="",
-                division="Northeast",
-                look_back_days=1,
-                start_date=date.today() - timedelta(days=1),
-                end_date=date.today(),
-                missing_table_api_url="https://api.example.com",
-                missing_table_api_key="test-key",
-                log_level="INFO",
-            )
+            ScrapingConfig(**{**valid_config_kwargs, "age_group": "U12"})
 
-    def test_validate_config_empty_age_group(self):
+    def test_validate_config_empty_age_group(self, valid_config_kwargs):
         """Test validation with empty age group (should be valid)."""
         # Should not raise any exception during creation
-        config = ScrapingConfig(
-            age_group="",  # Empty age group should be valid
-            club="",
-            competition="",
-            division="Northeast",
-            look_back_days=1,
-            start_date=date.today() - timedelta(days=1),
-            end_date=date.today(),
-            missing_table_api_url="https://api.example.com",
-            missing_table_api_key="test-key",
-            log_level="INFO",
-        )
+        config = ScrapingConfig(**{**valid_config_kwargs, "age_group": ""})
         assert config.age_group == ""
 
-    def test_validate_config_invalid_date_range(self):
+    def test_validate_config_invalid_date_range(
+        self, valid_config_kwargs, frozen_today
+    ):
         """Test validation with invalid date range."""
         with pytest.raises(
             ValidationError, match="start_date .* cannot be after end_date"
         ):
             ScrapingConfig(
-                age_group="U14",
-                club="",
-                competition="",
-                division="Northeast",
-                look_back_days=1,
-                start_date=date.today(),
-                end_date=date.today() - timedelta(days=1),  # End before start
-                missing_table_api_url="https://api.example.com",
-                missing_table_api_key="test-key",
-                log_level="INFO",
+                **{
+                    **valid_config_kwargs,
+                    "start_date": frozen_today,
+                    "end_date": frozen_today - timedelta(days=1),  # End before start
+                }
             )
 
-    def test_validate_config_invalid_log_level(self):
+    def test_validate_config_invalid_log_level(self, valid_config_kwargs):
         """Test validation with invalid log level."""
         with pytest.raises(ValidationError, match="Invalid log_level: INVALID"):
-            ScrapingConfig(
-                age_group="U14",
-                club="",
-                competition="",
-                division="Northeast",
-                look_back_days=1,
-                start_date=date.today() - timedelta(days=1),
-                end_date=date.today(),
-                missing_table_api_url="https://api.example.com",
-                missing_table_api_key="test-key",
-                log_level="INVALID",  # Invalid log level
-            )
+            ScrapingConfig(**{**valid_config_kwargs, "log_level": "INVALID"})
 
-    def test_validate_config_invalid_api_url(self):
+    def test_validate_config_invalid_api_url(self, valid_config_kwargs):
         """Test validation with invalid API URL."""
         with pytest.raises(
             ValidationError,
             match="missing_table_api_url must be a valid HTTP/HTTPS URL",
         ):
             ScrapingConfig(
-                age_group="U14",
-                club="",
-                competition="",
-                division="Northeast",
-                look_back_days=1,
-                start_date=date.today() - timedelta(days=1),
-                end_date=date.today(),
-                missing_table_api_url="invalid-url",  # Invalid URL format
-                missing_table_api_key="test-key",
-                log_level="INFO",
+                **{**valid_config_kwargs, "missing_table_api_url": "invalid-url"}
             )
 
-    def test_validate_config_case_insensitive_log_level(self):
+    def test_validate_config_case_insensitive_log_level(self, valid_config_kwargs):
         """Test validation with case-insensitive log level."""
-        # Should not raise any exception during creation
-        config = ScrapingConfig(
-            age_group="U14",
-            club="",
-            competition="",
-            division="Northeast",
-            look_back_days=1,
-            start_date=date.today() - timedelta(days=1),
-            end_date=date.today(),
-            missing_table_api_url="https://api.example.com",
-            missing_table_api_key="test-key",
-            log_level="debug",  # Lowercase should work
-        )
+        # Lowercase should work
+        config = ScrapingConfig(**{**valid_config_kwargs, "log_level": "debug"})
         assert config.log_level == "DEBUG"  # Should be normalized to uppercase
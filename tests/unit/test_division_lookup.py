@@ -1,5 +1,9 @@
 """Unit tests for division lookup utilities."""
 
+from collections.abc import Mapping
+
+import pytest
+
 from src.utils.division_lookup import (
     CONFERENCE_ID_MAP,
     DIVISION_ID_MAP,
@@ -14,95 +18,99 @@ from src.utils.division_lookup import (
 class TestDivisionLookup:
     """Test cases for division ID lookup functions."""
 
-    def test_get_division_id_valid(self):
+    @pytest.mark.parametrize(
+        "name,expected",
+        [("Northeast", 41), ("Central", 34), ("Mid-Atlantic", 68), ("California", 42)],
+    )
+    def test_get_division_id_valid(self, name, expected):
         """Test looking up valid division IDs."""
-        assert get_division_id("Northeast") == 41
-        assert get_division_id("Central") == 34
-        assert get_division_id("Mid-Atlantic") == 68
-        assert get_division_id("California") == 42
+        assert get_division_id(name) == expected
 
-    def test_get_division_id_invalid(self):
+    @pytest.mark.parametrize("name", ["Invalid", "", None])
+    def test_get_division_id_invalid(self, name):
         """Test looking up invalid division returns None."""
-        assert get_division_id("Invalid") is None
-        assert get_division_id("") is None
-        assert get_division_id(None) is None
-
-    def test_get_conference_id_valid(self):
+        assert get_division_id(name) is None
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("New England", 41),
+            ("Northeast", 41),  # Same as New England
+            ("Mid-Atlantic", 68),
+            ("California", 42),
+        ],
+    )
+    def test_get_conference_id_valid(self, name, expected):
         """Test looking up valid conference IDs."""
-        assert get_conference_id("New England") == 41
-        assert get_conference_id("Northeast") == 41  # Same as New England
-        assert get_conference_id("Mid-Atlantic") == 68
-        assert get_conference_id("California") == 42
+        assert get_conference_id(name) == expected
 
-    def test_get_conference_id_invalid(self):
+    @pytest.mark.parametrize("name", ["Invalid", "", None])
+    def test_get_conference_id_invalid(self, name):
         """Test looking up invalid conference returns None."""
-        assert get_conference_id("Invalid") is None
-        assert get_conference_id("") is None
-        assert get_conference_id(None) is None
-
-    def test_get_division_id_for_league_homegrown(self):
-        """Test division ID lookup for Homegrown league."""
-        # Homegrown uses division
-        result = get_division_id_for_league("Homegrown", "Northeast", None)
-        assert result == 41
-
-        result = get_division_id_for_league("Homegrown", "Central", None)
-        assert result == 34
-
-        # Conference should be ignored for Homegrown
-        result = get_division_id_for_league("Homegrown", "Northeast", "New England")
-        assert result == 41  # Should use division, not conference
-
-    def test_get_division_id_for_league_academy(self):
-        """Test division ID lookup for Academy league."""
-        # Academy uses conference
-        result = get_division_id_for_league("Academy", None, "New England")
-        assert result == 41
-
-        result = get_division_id_for_league("Academy", None, "Mid-Atlantic")
-        assert result == 68
-
-        # Should fall back to division if conference not provided
-        result = get_division_id_for_league("Academy", "Northeast", None)
-        assert result == 41
-
-    def test_get_division_id_for_league_academy_conference_priority(self):
-        """Test that Academy league prioritizes conference over division."""
-        # If both provided, conference should take precedence for Academy
-        result = get_division_id_for_league("Academy", "Central", "New England")
-        assert result == 41  # New England, not Central (34)
-
-    def test_get_division_id_for_league_missing_values(self):
-        """Test lookup returns None when required values are missing."""
-        # Homegrown with no division
-        assert get_division_id_for_league("Homegrown", None, None) is None
-
-        # Academy with no conference or division
-        assert get_division_id_for_league("Academy", None, None) is None
-
-        # Invalid league type
-        assert get_division_id_for_league("Invalid", "Northeast", None) is None
+        assert get_conference_id(name) is None
+
+    @pytest.mark.parametrize(
+        "league,division,conference,expected",
+        [
+            # Homegrown uses division
+            pytest.param("Homegrown", "Northeast", None, 41, id="homegrown"),
+            pytest.param("Homegrown", "Central", None, 34, id="homegrown-central"),
+            # Conference should be ignored for Homegrown
+            pytest.param(
+                "Homegrown", "Northeast", "New England", 41, id="homegrown-ignores-conf"
+            ),
+            # Academy uses conference
+            pytest.param("Academy", None, "New England", 41, id="academy"),
+            pytest.param(
+                "Academy", None, "Mid-Atlantic", 68, id="academy-mid-atlantic"
+            ),
+            # Should fall back to division if conference not provided
+            pytest.param("Academy", "Northeast", None, 41, id="academy-fallback"),
+            # If both provided, conference takes precedence for Academy
+            pytest.param(
+                "Academy", "Central", "New England", 41, id="academy-conf-priority"
+            ),
+            # Conferences and divisions resolve only against their own map
+            pytest.param("Academy", None, "East", None, id="academy-conf-not-div"),
+            pytest.param(
+                "Academy", "New England", None, None, id="academy-div-not-conf"
+            ),
+            # An unknown conference does not fall back to the division
+            pytest.param(
+                "Academy", "Northeast", "Unknown", None, id="academy-no-conf-fallback"
+            ),
+            # Missing values and unknown leagues
+            pytest.param("Homegrown", None, None, None, id="homegrown-missing"),
+            pytest.param("Academy", None, None, None, id="academy-missing"),
+            pytest.param("Invalid", "Northeast", None, None, id="invalid-league"),
+        ],
+    )
+    def test_get_division_id_for_league(self, league, division, conference, expected):
+        """Test division ID lookup by league type."""
+        assert get_division_id_for_league(league, division, conference) == expected
 
     def test_get_all_divisions(self):
         """Test getting all division mappings."""
         divisions = get_all_divisions()
-        assert isinstance(divisions, dict)
+        assert isinstance(divisions, Mapping)
         assert len(divisions) > 0
         assert divisions["Northeast"] == 41
         assert divisions["Central"] == 34
-        # Verify it's a copy, not the original
-        divisions["Test"] = 999
+        # Verify it's read-only
+        with pytest.raises(TypeError):
+            divisions["Test"] = 999
         assert "Test" not in DIVISION_ID_MAP
 
     def test_get_all_conferences(self):
         """Test getting all conference mappings."""
         conferences = get_all_conferences()
-        assert isinstance(conferences, dict)
+        assert isinstance(conferences, Mapping)
         assert len(conferences) > 0
         assert conferences["New England"] == 41
         assert conferences["Mid-Atlantic"] == 68
-        # Verify it's a copy, not the original
-        conferences["Test"] = 999
+        # Verify it's read-only
+        with pytest.raises(TypeError):
+            conferences["Test"] = 999
         assert "Test" not in CONFERENCE_ID_MAP
 
     def test_division_conference_id_consistency(self):
@@ -115,15 +123,20 @@ class TestDivisionLookup:
         assert get_division_id("Mid-Atlantic") == get_conference_id("Mid-Atlantic")
         assert get_division_id("Mid-Atlantic") == 68
 
-    def test_all_division_ids_are_positive(self):
+    @pytest.mark.parametrize(
+        "lookup_id",
+        [
+            *(pytest.param(v, id=f"division-{k}") for k, v in DIVISION_ID_MAP.items()),
+            *(
+                pytest.param(v, id=f"conference-{k}")
+                for k, v in CONFERENCE_ID_MAP.items()
+            ),
+        ],
+    )
+    def test_all_division_ids_are_positive(self, lookup_id):
         """Test that all division IDs are positive integers."""
-        for division_id in DIVISION_ID_MAP.values():
-            assert isinstance(division_id, int)
-            assert division_id > 0
-
-        for conference_id in CONFERENCE_ID_MAP.values():
-            assert isinstance(conference_id, int)
-            assert conference_id > 0
+        assert isinstance(lookup_id, int)
+        assert lookup_id > 0
 
     def test_no_duplicate_ids_within_maps(self):
         """Test that each ID is unique within its map."""
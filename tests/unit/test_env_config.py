@@ -0,0 +1,501 @@
+"""Unit tests for CLI environment configuration utilities."""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.cli import env_config
+from src.cli.env_config import (
+    OPTIONAL_ENV_VARS,
+    REQUIRED_ENV_VARS,
+    MissingConfigError,
+    check_config,
+    configure_session,
+    get_current_config,
+    get_env_file_path,
+    load_env_file,
+    save_env_file,
+    set_variable,
+    validate_config,
+)
+from tests.unit._stubs import ConsoleSpy
+
+
+@pytest.fixture(autouse=True)
+def clear_env_caches():
+    """Start every test without cached .env contents, roots or verdicts."""
+    env_config._ENV_CACHE.clear()
+    env_config._resolve_root.cache_clear()
+    env_config._VALIDATION_CACHE = None
+    yield
+    env_config._ENV_CACHE.clear()
+    env_config._resolve_root.cache_clear()
+    env_config._VALIDATION_CACHE = None
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Point the module at a .env file under tmp_path."""
+    path = tmp_path / ".env"
+    monkeypatch.setattr(env_config, "get_env_file_path", lambda: path)
+    return path
+
+
+@pytest.fixture
+def mock_console(monkeypatch):
+    """Replace the module console so output can be asserted on."""
+    console = ConsoleSpy()
+    monkeypatch.setattr(env_config, "console", console)
+    return console
+
+
+@pytest.fixture
+def clean_environ(monkeypatch):
+    """Unset every variable the config tables know about."""
+    for name in (*REQUIRED_ENV_VARS, *OPTIONAL_ENV_VARS):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(scope="module")
+def env_dir(tmp_path_factory):
+    """One directory shared by the parsing cases, one file per case."""
+    return tmp_path_factory.mktemp("envs")
+
+
+def _raise(exc):
+    """Build a stand-in method that always raises exc."""
+
+    def method(*args, **kwargs):
+        raise exc
+
+    return method
+
+
+class TestGetEnvFilePath:
+    """Test locating the .env file."""
+
+    def test_get_env_file_path_finds_project_root(self, tmp_path, monkeypatch):
+        (tmp_path / "pyproject.toml").touch()
+        subdir = tmp_path / "src" / "cli"
+        subdir.mkdir(parents=True)
+        monkeypatch.chdir(subdir)
+
+        assert get_env_file_path() == tmp_path / ".env"
+
+    def test_get_env_file_path_falls_back_to_cwd(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+        monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+
+        assert get_env_file_path() == tmp_path / ".env"
+
+    def test_get_env_file_path_caches_root_per_cwd(self, tmp_path, monkeypatch):
+        (tmp_path / "pyproject.toml").touch()
+        monkeypatch.chdir(tmp_path)
+        get_env_file_path()
+
+        monkeypatch.setattr(Path, "exists", _raise(AssertionError("rescanned")))
+        assert get_env_file_path() == tmp_path / ".env"
+
+
+class TestLoadEnvFile:
+    """Test reading the .env file."""
+
+    @pytest.mark.parametrize(
+        "filename,content,expected",
+        [
+            pytest.param(
+                "success.env",
+                "VAR1=value1\nVAR2=value2\n",
+                {"VAR1": "value1", "VAR2": "value2"},
+                id="success",
+            ),
+            pytest.param("missing.env", None, {}, id="missing"),
+            pytest.param(
+                "comments.env",
+                "# comment\n\nVAR1=value1\n# VAR2=value2\n",
+                {"VAR1": "value1"},
+                id="ignores-comments",
+            ),
+            pytest.param(
+                "quotes.env",
+                "VAR1=\"double\"\nVAR2='single'\n",
+                {"VAR1": "double", "VAR2": "single"},
+                id="strips-quotes",
+            ),
+            pytest.param(
+                "equals.env",
+                "URL=https://example.com/?a=1\n",
+                {"URL": "https://example.com/?a=1"},
+                id="equals-in-value",
+            ),
+            pytest.param(
+                "whitespace.env",
+                "  VAR1=value1  \r\n\tVAR2=value2\r\n   \r\n",
+                {"VAR1": "value1", "VAR2": "value2"},
+                id="trims-line-whitespace",
+            ),
+            pytest.param(
+                "dotenv.env",
+                'export VAR1=value1 # note\nVAR2="a#b"\nVAR3=$HOME\n',
+                {"VAR1": "value1", "VAR2": "a#b", "VAR3": "$HOME"},
+                id="export-inline-comment-no-expansion",
+            ),
+        ],
+    )
+    def test_load_env_file_parsing(
+        self, env_dir, monkeypatch, filename, content, expected
+    ):
+        path = env_dir / filename
+        if content is not None:
+            path.write_bytes(content.encode())
+        monkeypatch.setattr(env_config, "get_env_file_path", lambda: path)
+
+        assert load_env_file() == expected
+
+    def test_load_env_file_handles_read_error(
+        self, env_file, mock_console, monkeypatch
+    ):
+        env_file.write_text("VAR1=value1\n")
+        monkeypatch.setattr(
+            env_config, "dotenv_values", _raise(PermissionError("denied"))
+        )
+
+        assert load_env_file() == {}
+
+        assert any("Could not read .env file" in m for m in mock_console.messages)
+
+    def test_load_env_file_reuses_cached_contents(self, env_file, monkeypatch):
+        env_file.write_text("VAR1=value1\n")
+        load_env_file()
+
+        # An unchanged file is served from the cache without reopening it
+        monkeypatch.setattr(
+            env_config, "dotenv_values", _raise(AssertionError("reread"))
+        )
+        assert load_env_file() == {"VAR1": "value1"}
+
+    def test_load_env_file_returns_copy_of_cache(self, env_file):
+        env_file.write_text("VAR1=value1\n")
+
+        load_env_file()["VAR1"] = "changed"
+
+        assert load_env_file() == {"VAR1": "value1"}
+
+    def test_load_env_file_rereads_modified_file(self, env_file):
+        env_file.write_text("VAR1=value1\n")
+        load_env_file()
+
+        env_file.write_text("VAR1=value2\n")
+        mtime_ns = env_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(env_file, ns=(mtime_ns, mtime_ns))
+
+        assert load_env_file() == {"VAR1": "value2"}
+
+    def test_save_env_file_invalidates_cache(self, env_file):
+        env_file.write_text("VAR1=value1\n")
+        load_env_file()
+
+        assert save_env_file({"VAR1": "value2"})
+        assert load_env_file() == {"VAR1": "value2"}
+
+
+class TestSaveEnvFile:
+    """Test writing the .env file."""
+
+    def test_save_env_file_success(self, env_file):
+        assert save_env_file({"VAR1": "value1", "VAR2": "value2"})
+
+        content = env_file.read_text()
+        assert content.startswith("# MLS Match Scraper Environment Configuration\n")
+        assert content.endswith("VAR1=value1\nVAR2=value2\n")
+        assert not env_file.with_name(".env.tmp").exists()
+
+    def test_save_env_file_quotes_values_with_spaces(self, env_file):
+        assert save_env_file({"VAR1": "two words", "VAR2": "a#b", "VAR3": "plain"})
+
+        assert 'VAR1="two words"\nVAR2="a#b"\nVAR3=plain\n' in env_file.read_text()
+        assert load_env_file() == {"VAR1": "two words", "VAR2": "a#b", "VAR3": "plain"}
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param('a "b" c', id="inner-double-quotes"),
+            pytest.param("C:\\tmp dir\\new", id="backslash-escapes"),
+            pytest.param('a\\"b c', id="escaped-quote"),
+            pytest.param('say"hi"', id="double-quote"),
+            pytest.param('"leading', id="leading-double-quote"),
+            pytest.param("C:\\path", id="backslash"),
+            pytest.param("a\\nb", id="backslash-n"),
+            pytest.param("a#b", id="hash"),
+            pytest.param("a #b", id="hash-after-space"),
+            pytest.param("it's", id="single-quote"),
+            pytest.param("'wrapped'", id="single-quoted"),
+        ],
+    )
+    def test_save_env_file_round_trips_value(self, env_file, value):
+        assert save_env_file({"VAR1": value, "VAR2": "after"})
+
+        assert load_env_file() == {"VAR1": value, "VAR2": "after"}
+
+    def test_save_env_file_handles_write_error(
+        self, env_file, mock_console, monkeypatch
+    ):
+        env_file.write_text("VAR1=original\n")
+        with monkeypatch.context() as m:
+            m.setattr(os, "replace", _raise(OSError("disk full")))
+            assert not save_env_file({"VAR1": "changed"})
+
+        assert any("Error saving .env file" in m for m in mock_console.messages)
+        # The original file is left untouched
+        assert env_file.read_text() == "VAR1=original\n"
+        assert not env_file.with_name(".env.tmp").exists()
+
+    def test_save_env_file_handles_cleanup_error(self, env_file, mock_console):
+        env_file.write_text("VAR1=original\n")
+        # A directory in the way fails both the write and the cleanup unlink
+        env_file.with_name(".env.tmp").mkdir()
+
+        assert not save_env_file({"VAR1": "changed"})
+
+        assert any("Error saving .env file" in m for m in mock_console.messages)
+        assert env_file.read_text() == "VAR1=original\n"
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    @pytest.mark.parametrize("mode", [0o600, 0o640])
+    def test_save_env_file_keeps_permissions(self, env_file, mode):
+        env_file.write_text("VAR1=original\n")
+        env_file.chmod(mode)
+
+        assert save_env_file({"VAR1": "changed"})
+
+        assert stat.S_IMODE(env_file.stat().st_mode) == mode
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_save_env_file_creates_private_file(self, env_file):
+        assert save_env_file({"VAR1": "value1"})
+
+        assert stat.S_IMODE(env_file.stat().st_mode) == 0o600
+
+    def test_save_env_file_writes_through_symlink(self, tmp_path, monkeypatch):
+        target = tmp_path / "shared.env"
+        target.write_text("VAR1=original\n")
+        link = tmp_path / ".env"
+        link.symlink_to(target)
+        monkeypatch.setattr(env_config, "get_env_file_path", lambda: link)
+
+        assert save_env_file({"VAR1": "changed"})
+
+        assert link.is_symlink()
+        assert load_env_file() == {"VAR1": "changed"}
+
+
+class TestGetCurrentConfig:
+    """Test merging the environment, the .env file and defaults."""
+
+    FULL_ENV = {
+        "MISSING_TABLE_API_BASE_URL": "https://env.example.com",
+        "MISSING_TABLE_API_TOKEN": "env-token",
+        "LOG_LEVEL": "DEBUG",
+        "AGE_GROUP": "U16",
+        "DIVISION": "Texas",
+        "LOOK_BACK_DAYS": "5",
+    }
+
+    def test_get_current_config_from_env_vars(self, env_file, clean_environ):
+        env_file.write_text("MISSING_TABLE_API_TOKEN=file-token\n")
+        for name, value in self.FULL_ENV.items():
+            clean_environ.setenv(name, value)
+        mock_load = MagicMock()
+        clean_environ.setattr(env_config, "load_env_file", mock_load)
+
+        required, optional = get_current_config()
+
+        # Everything comes from the environment, so the file is never read
+        mock_load.assert_not_called()
+        assert required["MISSING_TABLE_API_TOKEN"] == "env-token"
+        assert optional["DIVISION"] == "Texas"
+
+    def test_get_current_config_from_env_file(self, env_file, clean_environ):
+        env_file.write_text(
+            "MISSING_TABLE_API_BASE_URL=https://file.example.com\n"
+            "MISSING_TABLE_API_TOKEN=file-token\n"
+            "AGE_GROUP=U17\n"
+        )
+
+        required, optional = get_current_config()
+
+        assert required == {
+            "MISSING_TABLE_API_BASE_URL": "https://file.example.com",
+            "MISSING_TABLE_API_TOKEN": "file-token",
+        }
+        assert optional["AGE_GROUP"] == "U17"
+
+    def test_get_current_config_env_takes_precedence(self, env_file, clean_environ):
+        env_file.write_text("MISSING_TABLE_API_TOKEN=file-token\nLOG_LEVEL=ERROR\n")
+        clean_environ.setenv("MISSING_TABLE_API_TOKEN", "env-token")
+
+        required, optional = get_current_config()
+
+        assert required["MISSING_TABLE_API_TOKEN"] == "env-token"
+        assert required["MISSING_TABLE_API_BASE_URL"] is None
+        assert optional["LOG_LEVEL"] == "ERROR"
+
+    def test_get_current_config_uses_defaults(self, env_file, clean_environ):
+        required, optional = get_current_config()
+
+        assert required == dict.fromkeys(REQUIRED_ENV_VARS)
+        assert optional == {
+            name: info["default"] for name, info in OPTIONAL_ENV_VARS.items()
+        }
+
+
+class TestSetVariable:
+    """Test setting individual variables."""
+
+    def test_set_variable_success(self, env_file, mock_console):
+        env_file.write_text("AGE_GROUP=U15\n")
+
+        assert set_variable("LOG_LEVEL", "DEBUG")
+
+        assert load_env_file() == {"AGE_GROUP": "U15", "LOG_LEVEL": "DEBUG"}
+
+    def test_set_variable_invalid_name(self, env_file, mock_console):
+        assert not set_variable("NOT_A_VAR", "value")
+
+        assert "Unknown variable" in mock_console.messages[0]
+        assert not env_file.exists()
+
+    def test_set_variable_invalid_choice(self, env_file, mock_console):
+        assert not set_variable("LOG_LEVEL", "LOUD")
+
+        assert "Invalid value" in mock_console.messages[0]
+        assert not env_file.exists()
+
+    def test_set_variable_skips_load_when_current_provided(
+        self, env_file, mock_console, monkeypatch
+    ):
+        mock_load = MagicMock()
+        monkeypatch.setattr(env_config, "load_env_file", mock_load)
+        current = {"AGE_GROUP": "U15"}
+
+        assert set_variable("LOG_LEVEL", "DEBUG", current=current)
+
+        mock_load.assert_not_called()
+        assert current == {"AGE_GROUP": "U15", "LOG_LEVEL": "DEBUG"}
+        assert env_file.read_text().endswith("AGE_GROUP=U15\nLOG_LEVEL=DEBUG\n")
+
+    def test_set_variable_batch_single_write(self, env_file, mock_console, monkeypatch):
+        env_file.write_text("AGE_GROUP=U15\n")
+        mock_save = MagicMock(wraps=save_env_file)
+        monkeypatch.setattr(env_config, "save_env_file", mock_save)
+
+        with configure_session():
+            assert set_variable("LOG_LEVEL", "DEBUG")
+            assert set_variable("DIVISION", "Texas")
+            assert set_variable("LOOK_BACK_DAYS", "7")
+
+        mock_save.assert_called_once()
+        assert load_env_file() == {
+            "AGE_GROUP": "U15",
+            "LOG_LEVEL": "DEBUG",
+            "DIVISION": "Texas",
+            "LOOK_BACK_DAYS": "7",
+        }
+        assert env_config._BATCH_MODE is False
+        assert env_config._PENDING is None
+
+    def test_set_variable_nested_batch(self, env_file, mock_console, monkeypatch):
+        env_file.write_text("LOG_LEVEL=INFO\n")
+        mock_save = MagicMock(wraps=save_env_file)
+        monkeypatch.setattr(env_config, "save_env_file", mock_save)
+
+        with configure_session():
+            assert set_variable("AGE_GROUP", "U16")
+            with configure_session():
+                assert set_variable("DIVISION", "Central")
+            mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+        assert load_env_file() == {
+            "LOG_LEVEL": "INFO",
+            "AGE_GROUP": "U16",
+            "DIVISION": "Central",
+        }
+        assert env_config._BATCH_MODE is False
+        assert env_config._PENDING is None
+
+
+class TestValidateConfig:
+    """Test required-variable validation."""
+
+    def test_validate_config_all_set(self, env_file, mock_console, clean_environ):
+        env_file.write_text(
+            "MISSING_TABLE_API_BASE_URL=https://api.example.com\n"
+            "MISSING_TABLE_API_TOKEN=token\n"
+        )
+
+        assert validate_config()
+        assert "All required environment variables" in mock_console.messages[0]
+
+    def test_check_config_missing_required(self, env_file, clean_environ):
+        clean_environ.setenv("MISSING_TABLE_API_BASE_URL", "https://api.example.com")
+
+        with pytest.raises(MissingConfigError) as exc:
+            check_config()
+
+        assert exc.value.missing == ["MISSING_TABLE_API_TOKEN"]
+
+    def test_validate_config_reports_missing(
+        self, env_file, mock_console, clean_environ
+    ):
+        clean_environ.setenv("MISSING_TABLE_API_BASE_URL", "https://api.example.com")
+
+        assert not validate_config()
+        assert any("MISSING_TABLE_API_TOKEN" in m for m in mock_console.messages)
+        assert not any("MISSING_TABLE_API_BASE_URL" in m for m in mock_console.messages)
+
+    def test_validate_config_reuses_verdict(
+        self, env_file, mock_console, clean_environ
+    ):
+        clean_environ.setenv("MISSING_TABLE_API_BASE_URL", "https://api.example.com")
+        assert not validate_config()
+
+        mock_get = MagicMock()
+        clean_environ.setattr(env_config, "get_current_config", mock_get)
+
+        assert not validate_config()
+        mock_get.assert_not_called()
+        assert any("MISSING_TABLE_API_TOKEN" in m for m in mock_console.messages)
+
+    def test_validate_config_rechecks_after_change(
+        self, env_file, mock_console, clean_environ
+    ):
+        clean_environ.setenv("MISSING_TABLE_API_BASE_URL", "https://api.example.com")
+        assert not validate_config()
+
+        assert set_variable("MISSING_TABLE_API_TOKEN", "token")
+        assert validate_config()
+
+        clean_environ.delenv("MISSING_TABLE_API_BASE_URL")
+        assert not validate_config()
+
+
+class TestConstants:
+    """Test the variable tables and their lookup copies."""
+
+    def test_lookup_sets_match_tables(self):
+        assert env_config._ALL_VAR_NAMES == {
+            *env_config.REQUIRED_ENV_VARS,
+            *env_config.OPTIONAL_ENV_VARS,
+        }
+        for name, choices in env_config._CHOICES_FROZEN.items():
+            assert choices == set(env_config.OPTIONAL_ENV_VARS[name]["choices"])
+
+    def test_tables_are_read_only(self):
+        with pytest.raises(TypeError):
+            env_config.OPTIONAL_ENV_VARS["NEW_VAR"] = {}  # type: ignore[index]
+        assert isinstance(env_config.OPTIONAL_ENV_VARS["LOG_LEVEL"]["choices"], tuple)
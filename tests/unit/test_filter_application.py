@@ -5,7 +5,7 @@ Tests filter application methods, validation, error handling, and result loading
 """
 
 from datetime import date
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,45 +13,85 @@ from src.scraper.browser import ElementInteractor
 from src.scraper.config import ScrapingConfig
 from src.scraper.filter_application import FilterApplicationError, MLSFilterApplicator
 
+# Read-only in every test, so built once for the module
+_SAMPLE_CONFIG = ScrapingConfig(
+    age_group="U14",
+    club="Test Club",
+    competition="Test Competition",
+    division="Northeast",
+    look_back_days=1,
+    start_date=date.today(),
+    end_date=date.today(),
+    missing_table_api_url="https://api.example.com",
+    missing_table_api_key="test-key",
+    log_level="INFO",
+)
+
+
+def _select_frame():
+    """
+    Build an iframe mock whose locators all resolve to one present <select>.
+
+    Returns the iframe mock and the select mock.
+    """
+    select = MagicMock()
+    select.count = AsyncMock(return_value=1)
+    select.select_option = AsyncMock(return_value=None)
+
+    iframe_content = MagicMock()
+    iframe_content.locator = lambda selector: select
+    return iframe_content, select
+
+
+@pytest.fixture(scope="module")
+def mock_page():
+    """Create a mock Playwright page, shared by the tests in this module."""
+    page = AsyncMock()
+    page.query_selector_all = AsyncMock()
+    return page
+
 
 class TestMLSFilterApplicator:
     """Test cases for MLSFilterApplicator class."""
 
-    @pytest.fixture
-    def mock_page(self):
-        """Create a mock Playwright page."""
-        page = AsyncMock()
-        page.query_selector_all = AsyncMock()
-        return page
-
-    @pytest.fixture
-    def mock_interactor(self):
-        """Create a mock ElementInteractor."""
-        interactor = AsyncMock(spec=ElementInteractor)
-        return interactor
+    @pytest.fixture(autouse=True)
+    def reset_mock_page(self, mock_page):
+        """Clear calls and configured results left by the previous test."""
+        yield
+        mock_page.reset_mock(return_value=True, side_effect=True)
 
     @pytest.fixture
     def filter_applicator(self, mock_page):
         """Create MLSFilterApplicator instance with mocked dependencies."""
         return MLSFilterApplicator(mock_page, timeout=5000)
 
+    @pytest.fixture
+    def patched_applicator(self, filter_applicator, monkeypatch):
+        """
+        Stub the steps apply_all_filters() and validate_filters() delegate to.
+
+        Every step succeeds by default and option discovery finds nothing.
+        Returns the applicator and the mocks by attribute name, so a test can
+        change one step's result.
+        """
+        mocks = {
+            "discover_available_options": AsyncMock(return_value={}),
+            "apply_age_group_filter": AsyncMock(return_value=True),
+            "apply_club_filter": AsyncMock(return_value=True),
+            "apply_competition_filter": AsyncMock(return_value=True),
+            "apply_division_filter": AsyncMock(return_value=True),
+            "wait_for_filter_results": AsyncMock(return_value=True),
+            "_validate_filter_option": AsyncMock(return_value=True),
+        }
+        for name, mock in mocks.items():
+            monkeypatch.setattr(filter_applicator, name, mock)
+        return filter_applicator, mocks
+
     @pytest.fixture
     def sample_config(self):
         """Create a sample ScrapingConfig for testing."""
-        return ScrapingConfig(
-            age_group="U14",
-            club="Test Club",
-            competition="Test Competition",
-            division="Northeast",
-            look_back_days=1,
-            start_date=date.today(),
-            end_date=date.today(),
-            missing_table_api_url="https://api.example.com",
-            missing_table_api_key="test-key",
-            log_level="INFO",
-        )
+        return _SAMPLE_CONFIG
 
-    @pytest.mark.asyncio
     async def test_init(self, mock_page):
         """Test MLSFilterApplicator initialization."""
         applicator = MLSFilterApplicator(mock_page, timeout=10000)
@@ -61,7 +101,6 @@ class TestMLSFilterApplicator:
         assert isinstance(applicator.interactor, ElementInteractor)
         assert applicator._available_options == {}
 
-    @pytest.mark.asyncio
     async def test_discover_available_options_success(
         self, filter_applicator, mock_page
     ):
@@ -79,7 +118,6 @@ class TestMLSFilterApplicator:
         assert len(options["club"]) == 0
         assert len(options["competition"]) == 0
 
-    @pytest.mark.asyncio
     async def test_discover_available_options_no_elements(self, filter_applicator):
         """Test discovery when no filter elements are found."""
         # Mock _get_iframe_content to return None to trigger the fallback logic
@@ -93,44 +131,55 @@ class TestMLSFilterApplicator:
         assert len(options["club"]) == 0  # Should be empty
         assert len(options["competition"]) == 0  # Should be empty
 
-    @pytest.mark.asyncio
-    async def test_apply_age_group_filter_success(self, filter_applicator):
-        """Test successful age group filter application."""
-        # Create properly mocked iframe content and select element
-        from unittest.mock import MagicMock
-
-        mock_iframe_content = MagicMock()
-        mock_select = MagicMock()
-
-        # Make count() async and return 1
-        async def async_count():
-            return 1
-
-        mock_select.count = async_count
-
-        # Make select_option() async
-        async def async_select_option(value=None):
-            return None
-
-        mock_select.select_option = async_select_option
-
-        # Mock locator to return our select mock
-        mock_iframe_content.locator = lambda selector: mock_select
-
-        with patch.object(
-            filter_applicator, "_get_iframe_content", return_value=mock_iframe_content
+    @pytest.mark.parametrize(
+        "method_name,value,expected_call",
+        [
+            # Age groups and divisions select by option value, clubs and
+            # competitions by visible label
+            ("apply_age_group_filter", "U14", {"value": "22"}),
+            ("apply_club_filter", "Test Club", {"label": "Test Club"}),
+            (
+                "apply_competition_filter",
+                "Test Competition",
+                {"label": "Test Competition"},
+            ),
+            ("apply_division_filter", "Northeast", {"value": "41"}),
+        ],
+    )
+    async def test_apply_filter_success(
+        self, filter_applicator, method_name, value, expected_call
+    ):
+        """Test successful filter application through the iframe dropdown."""
+        iframe_content, select = _select_frame()
+        with (
+            patch.object(
+                filter_applicator, "_validate_filter_option", return_value=True
+            ),
+            patch.object(
+                filter_applicator,
+                "_get_iframe_content",
+                return_value=iframe_content,
+            ),
         ):
-            result = await filter_applicator.apply_age_group_filter("U14")
-
+            result = await getattr(filter_applicator, method_name)(value)
             assert result is True
 
-    @pytest.mark.asyncio
-    async def test_apply_age_group_filter_empty_value(self, filter_applicator):
-        """Test age group filter with empty value."""
-        result = await filter_applicator.apply_age_group_filter("")
-        assert result is True  # Empty values should be accepted
+        select.select_option.assert_awaited_once_with(**expected_call)
+
+    @pytest.mark.parametrize(
+        "method_name",
+        [
+            "apply_age_group_filter",
+            "apply_club_filter",
+            "apply_competition_filter",
+            "apply_division_filter",
+        ],
+    )
+    async def test_apply_filter_empty_value(self, filter_applicator, method_name):
+        """Test that an empty filter value is accepted without interaction."""
+        result = await getattr(filter_applicator, method_name)("")
+        assert result is True
 
-    @pytest.mark.asyncio
     async def test_apply_age_group_filter_invalid_value(self, filter_applicator):
         """Test age group filter with invalid value."""
         with patch.object(
@@ -139,7 +188,6 @@ class TestMLSFilterApplicator:
             result = await filter_applicator.apply_age_group_filter("InvalidAge")
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_apply_age_group_filter_no_element_found(self, filter_applicator):
         """Test age group filter when no dropdown element is found."""
         # Mock iframe content returning None to simulate iframe access failure
@@ -152,180 +200,36 @@ class TestMLSFilterApplicator:
             result = await filter_applicator.apply_age_group_filter("U14")
             assert result is False
 
-    @pytest.mark.asyncio
-    async def test_apply_club_filter_success(self, filter_applicator):
-        """Test successful club filter application."""
-        # Create properly mocked iframe content and select element
-        from unittest.mock import MagicMock
-
-        mock_iframe_content = MagicMock()
-        mock_select = MagicMock()
-
-        # Make count() async and return 1
-        async def async_count():
-            return 1
-
-        mock_select.count = async_count
-
-        # Make select_option() async
-        async def async_select_option(label=None):
-            return None
-
-        mock_select.select_option = async_select_option
-
-        # Mock locator to return our select mock
-        mock_iframe_content.locator = lambda selector: mock_select
-
-        with (
-            patch.object(
-                filter_applicator, "_validate_filter_option", return_value=True
-            ),
-            patch.object(
-                filter_applicator,
-                "_get_iframe_content",
-                return_value=mock_iframe_content,
-            ),
-        ):
-            result = await filter_applicator.apply_club_filter("Test Club")
-            assert result is True
+    async def test_apply_all_filters_success(self, patched_applicator, sample_config):
+        """Test successful application of all filters."""
+        applicator, _ = patched_applicator
 
-    @pytest.mark.asyncio
-    async def test_apply_club_filter_empty_value(self, filter_applicator):
-        """Test club filter with empty value."""
-        result = await filter_applicator.apply_club_filter("")
+        result = await applicator.apply_all_filters(sample_config)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_apply_competition_filter_success(self, filter_applicator):
-        """Test successful competition filter application."""
-        # Create properly mocked iframe content and select element
-        from unittest.mock import MagicMock
-
-        mock_iframe_content = MagicMock()
-        mock_select = MagicMock()
-
-        # Make count() async and return 1
-        async def async_count():
-            return 1
-
-        mock_select.count = async_count
-
-        # Make select_option() async
-        async def async_select_option(label=None):
-            return None
-
-        mock_select.select_option = async_select_option
-
-        # Mock locator to return our select mock
-        mock_iframe_content.locator = lambda selector: mock_select
-
-        with (
-            patch.object(
-                filter_applicator, "_validate_filter_option", return_value=True
-            ),
-            patch.object(
-                filter_applicator,
-                "_get_iframe_content",
-                return_value=mock_iframe_content,
-            ),
-        ):
-            result = await filter_applicator.apply_competition_filter(
-                "Test Competition"
-            )
-            assert result is True
-
-    @pytest.mark.asyncio
-    async def test_apply_division_filter_success(self, filter_applicator):
-        """Test successful division filter application."""
-        from unittest.mock import MagicMock
-
-        mock_iframe_content = MagicMock()
-        mock_locator = MagicMock()
-
-        # Make select_option() async on the locator (select[js-groups])
-        async def async_select_option(value=None, label=None):
-            return None
-
-        mock_locator.select_option = async_select_option
-
-        # Make count() async and return 1 (element found)
-        async def async_count():
-            return 1
-
-        mock_locator.count = async_count
-
-        # Mock locator to return our mock for select[js-groups]
-        mock_iframe_content.locator = lambda selector: mock_locator
-
-        with (
-            patch.object(
-                filter_applicator, "_validate_filter_option", return_value=True
-            ),
-            patch.object(
-                filter_applicator,
-                "_get_iframe_content",
-                return_value=mock_iframe_content,
-            ),
-        ):
-            result = await filter_applicator.apply_division_filter("Northeast")
-            assert result is True
-
-    @pytest.mark.asyncio
-    async def test_apply_all_filters_success(self, filter_applicator, sample_config):
-        """Test successful application of all filters."""
-        with (
-            patch.object(
-                filter_applicator, "discover_available_options", return_value={}
-            ),
-            patch.object(
-                filter_applicator, "apply_age_group_filter", return_value=True
-            ),
-            patch.object(filter_applicator, "apply_club_filter", return_value=True),
-            patch.object(
-                filter_applicator, "apply_competition_filter", return_value=True
-            ),
-            patch.object(filter_applicator, "apply_division_filter", return_value=True),
-            patch.object(
-                filter_applicator, "wait_for_filter_results", return_value=True
-            ),
-        ):
-            result = await filter_applicator.apply_all_filters(sample_config)
-            assert result is True
-
-    @pytest.mark.asyncio
     async def test_apply_all_filters_age_group_failure(
-        self, filter_applicator, sample_config
+        self, patched_applicator, sample_config
     ):
         """Test apply_all_filters when age group filter fails."""
-        with (
-            patch.object(
-                filter_applicator, "discover_available_options", return_value={}
-            ),
-            patch.object(
-                filter_applicator, "apply_age_group_filter", return_value=False
-            ),
-        ):
-            result = await filter_applicator.apply_all_filters(sample_config)
-            assert result is False
+        applicator, mocks = patched_applicator
+        mocks["apply_age_group_filter"].return_value = False
 
-    @pytest.mark.asyncio
-    async def test_apply_all_filters_club_failure(
-        self, filter_applicator, sample_config
+        result = await applicator.apply_all_filters(sample_config)
+        assert result is False
+
+    async def test_apply_all_filters_tolerates_club_failure(
+        self, patched_applicator, sample_config
     ):
-        """Test apply_all_filters when club filter fails."""
-        with (
-            patch.object(
-                filter_applicator, "discover_available_options", return_value={}
-            ),
-            patch.object(
-                filter_applicator, "apply_age_group_filter", return_value=True
-            ),
-            patch.object(filter_applicator, "apply_club_filter", return_value=False),
-        ):
-            result = await filter_applicator.apply_all_filters(sample_config)
-            assert result is False
+        """Test that a failed club filter does not fail apply_all_filters."""
+        applicator, mocks = patched_applicator
+        mocks["apply_club_filter"].return_value = False
+
+        result = await applicator.apply_all_filters(sample_config)
+
+        assert result is True
+        mocks["apply_competition_filter"].assert_awaited_once()
+        mocks["wait_for_filter_results"].assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_wait_for_filter_results_success(self, filter_applicator):
         """Test successful waiting for filter results."""
         with patch.object(
@@ -344,7 +248,6 @@ class TestMLSFilterApplicator:
             result = await filter_applicator.wait_for_filter_results()
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_wait_for_filter_results_no_results_container(
         self, filter_applicator
     ):
@@ -355,47 +258,33 @@ class TestMLSFilterApplicator:
             result = await filter_applicator.wait_for_filter_results()
             assert result is True  # Should still return True with generic wait
 
-    @pytest.mark.asyncio
-    async def test_validate_filters_success(self, filter_applicator, sample_config):
+    async def test_validate_filters_success(self, patched_applicator, sample_config):
         """Test successful filter validation."""
-        with (
-            patch.object(
-                filter_applicator, "discover_available_options", return_value={}
-            ),
-            patch.object(
-                filter_applicator, "_validate_filter_option", return_value=True
-            ),
-        ):
-            results = await filter_applicator.validate_filters(sample_config)
+        applicator, _ = patched_applicator
+
+        results = await applicator.validate_filters(sample_config)
 
-            assert all(results.values())
-            assert len(results) == 4
+        assert all(results.values())
+        assert len(results) == 4
 
-    @pytest.mark.asyncio
     async def test_validate_filters_mixed_results(
-        self, filter_applicator, sample_config
+        self, patched_applicator, sample_config
     ):
         """Test filter validation with mixed results."""
+        applicator, mocks = patched_applicator
 
         def mock_validate(filter_type, value):
             return filter_type in ["age_group", "division"]
 
-        with (
-            patch.object(
-                filter_applicator, "discover_available_options", return_value={}
-            ),
-            patch.object(
-                filter_applicator, "_validate_filter_option", side_effect=mock_validate
-            ),
-        ):
-            results = await filter_applicator.validate_filters(sample_config)
+        mocks["_validate_filter_option"].side_effect = mock_validate
+
+        results = await applicator.validate_filters(sample_config)
 
-            assert results["age_group"] is True
-            assert results["division"] is True
-            assert results["club"] is False
-            assert results["competition"] is False
+        assert results["age_group"] is True
+        assert results["division"] is True
+        assert results["club"] is False
+        assert results["competition"] is False
 
-    @pytest.mark.asyncio
     async def test_get_dropdown_options_success(self, filter_applicator, mock_page):
         """Test successful dropdown options retrieval."""
         # Mock option elements
@@ -420,7 +309,6 @@ class TestMLSFilterApplicator:
             assert "U15" in options
             assert len(options) == 2
 
-    @pytest.mark.asyncio
     async def test_get_dropdown_options_no_element(self, filter_applicator):
         """Test dropdown options retrieval when no element is found."""
         with patch.object(
@@ -431,7 +319,6 @@ class TestMLSFilterApplicator:
             )
             assert options == []
 
-    @pytest.mark.asyncio
     async def test_get_dropdown_options_filters_empty_values(
         self, filter_applicator, mock_page
     ):
@@ -462,7 +349,6 @@ class TestMLSFilterApplicator:
             assert "select" not in options
             assert "choose" not in options
 
-    @pytest.mark.asyncio
     async def test_validate_filter_option_empty_value(self, filter_applicator):
         """Test validation of empty filter values."""
         result = await filter_applicator._validate_filter_option("age_group", "")
@@ -471,7 +357,6 @@ class TestMLSFilterApplicator:
         result = await filter_applicator._validate_filter_option("age_group", "   ")
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_validate_filter_option_with_discovered_options(
         self, filter_applicator
     ):
@@ -484,7 +369,6 @@ class TestMLSFilterApplicator:
         result = await filter_applicator._validate_filter_option("age_group", "U99")
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_validate_filter_option_case_insensitive(self, filter_applicator):
         """Test case-insensitive validation."""
         filter_applicator._available_options = {"age_group": {"U14", "U15"}}
@@ -492,7 +376,6 @@ class TestMLSFilterApplicator:
         result = await filter_applicator._validate_filter_option("age_group", "u14")
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_validate_filter_option_hardcoded_age_group(self, filter_applicator):
         """Test validation using hardcoded age group values."""
         # No discovered options, should fall back to hardcoded
@@ -502,7 +385,6 @@ class TestMLSFilterApplicator:
         result = await filter_applicator._validate_filter_option("age_group", "U99")
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_validate_filter_option_hardcoded_division(self, filter_applicator):
         """Test validation using hardcoded division values."""
         result = await filter_applicator._validate_filter_option(
@@ -515,7 +397,6 @@ class TestMLSFilterApplicator:
         )
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_validate_filter_option_club_competition_fallback(
         self, filter_applicator
     ):
@@ -532,7 +413,6 @@ class TestMLSFilterApplicator:
         result = await filter_applicator._validate_filter_option("club", "")
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_error_handling_in_apply_age_group_filter(self, filter_applicator):
         """Test error handling in apply_age_group_filter."""
         with patch.object(
@@ -543,7 +423,6 @@ class TestMLSFilterApplicator:
             result = await filter_applicator.apply_age_group_filter("U14")
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_error_handling_in_discover_available_options(
         self, filter_applicator
     ):
@@ -565,7 +444,6 @@ class TestMLSFilterApplicator:
             assert "age_group" in options
             assert "division" in options
 
-    @pytest.mark.asyncio
     async def test_error_handling_in_validate_filters(
         self, filter_applicator, sample_config
     ):
@@ -578,7 +456,6 @@ class TestMLSFilterApplicator:
             results = await filter_applicator.validate_filters(sample_config)
             assert all(not result for result in results.values())
 
-    @pytest.mark.asyncio
     async def test_multiple_selector_fallback(self, filter_applicator):
         """Test that multiple selectors are tried in order."""
         # Setup proper iframe content mock
@@ -622,29 +499,14 @@ class TestMLSFilterApplicator:
             result = await filter_applicator.apply_age_group_filter("U14")
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_filter_application_with_delays(
-        self, filter_applicator, sample_config
+        self, patched_applicator, sample_config
     ):
         """Test that delays are properly applied between filter applications."""
-        with (
-            patch("asyncio.sleep") as mock_sleep,
-            patch.object(
-                filter_applicator, "discover_available_options", return_value={}
-            ),
-            patch.object(
-                filter_applicator, "apply_age_group_filter", return_value=True
-            ),
-            patch.object(filter_applicator, "apply_club_filter", return_value=True),
-            patch.object(
-                filter_applicator, "apply_competition_filter", return_value=True
-            ),
-            patch.object(filter_applicator, "apply_division_filter", return_value=True),
-            patch.object(
-                filter_applicator, "wait_for_filter_results", return_value=True
-            ),
-        ):
-            await filter_applicator.apply_all_filters(sample_config)
+        applicator, _ = patched_applicator
+
+        with patch("asyncio.sleep") as mock_sleep:
+            await applicator.apply_all_filters(sample_config)
 
             # Should have 5 sleep calls:
             # 1. Iframe loading wait (5 seconds)
@@ -697,20 +559,8 @@ class TestMLSFilterApplicatorIntegration:
     @pytest.fixture
     def sample_config(self):
         """Create a sample ScrapingConfig for testing."""
-        return ScrapingConfig(
-            age_group="U14",
-            club="Test Club",
-            competition="Test Competition",
-            division="Northeast",
-            look_back_days=1,
-            start_date=date.today(),
-            end_date=date.today(),
-            missing_table_api_url="https://api.example.com",
-            missing_table_api_key="test-key",
-            log_level="INFO",
-        )
+        return _SAMPLE_CONFIG
 
-    @pytest.mark.asyncio
     async def test_complete_filter_workflow(
         self, mock_page_with_elements, sample_config
     ):
@@ -749,7 +599,6 @@ class TestMLSFilterApplicatorIntegration:
             filter_success = await applicator.apply_all_filters(sample_config)
             assert filter_success is True
 
-    @pytest.mark.asyncio
     async def test_realistic_error_scenarios(
         self, mock_page_with_elements, sample_config
     ):
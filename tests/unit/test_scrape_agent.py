@@ -19,9 +19,11 @@ from src.cli.main import (
     build_match_dict,
     create_config,
     normalize_team_name_for_display,
+    run_scraper,
     save_matches_to_file,
 )
 from src.scraper.config import ScrapingConfig
+from src.scraper.mls_scraper import MLSScraperError
 from src.scraper.models import Match
 from src.utils.match_comparison import MatchComparison
 
@@ -666,8 +668,6 @@ class TestRunScraperWrapper:
     @patch("src.cli.main.MLSScraper")
     def test_returns_matches_on_success(self, mock_scraper_cls):
         """run_scraper wraps MLSScraper and returns Match list."""
-        from src.cli.main import run_scraper
-
         expected_matches = [_make_match(), _make_match(match_id="m2", away_team="C")]
         mock_scraper = MagicMock()
         mock_scraper.scrape_matches = AsyncMock(return_value=expected_matches)
@@ -682,9 +682,6 @@ class TestRunScraperWrapper:
     @patch("src.cli.main.MLSScraper")
     def test_reraises_mls_scraper_error(self, mock_scraper_cls):
         """run_scraper re-raises MLSScraperError."""
-        from src.cli.main import run_scraper
-        from src.scraper.mls_scraper import MLSScraperError
-
         mock_scraper = MagicMock()
         mock_scraper.scrape_matches = AsyncMock(
             side_effect=MLSScraperError("Scrape failed")